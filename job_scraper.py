@@ -21,6 +21,8 @@
 
 import os
 import re
+import csv
+import html
 import json
 import time
 import random
@@ -29,25 +31,50 @@ import logging
 import sqlite3
 import threading
 import ssl
+import socket
+import gzip
+import queue
+import shutil
+import atexit
 import asyncio
+import importlib.util
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, cached_property
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Any, Tuple, Set
+from typing import TYPE_CHECKING, List, Dict, Optional, Any, Tuple, Set
 from urllib.parse import urlencode, quote_plus
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from logging.handlers import QueueHandler, QueueListener, MemoryHandler, RotatingFileHandler
 from urllib.error import URLError, HTTPError
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+import lxml.html
+from lxml import etree
+
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
 
 try:
     from fake_useragent import UserAgent  # type: ignore
 except ImportError:  # pragma: no cover
     UserAgent = None  # type: ignore
 
+try:
+    import aiohttp  # type: ignore
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 import feedparser
-import pandas as pd
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type, retry_if_exception
 
 # Selenium imports
 from selenium import webdriver
@@ -65,10 +92,9 @@ from telegram import Bot
 from telegram.constants import ParseMode
 from telegram.error import TelegramError, RetryAfter
 
-# Google Colab specific
+# Google Colab specific (detected without importing it; drive is imported on mount)
 try:
-    from google.colab import drive
-    IN_COLAB = True
+    IN_COLAB = importlib.util.find_spec('google.colab') is not None
 except ImportError:
     IN_COLAB = False
 
@@ -80,15 +106,41 @@ FALLBACK_USER_AGENTS: List[str] = [
 ]
 
 
+@lru_cache(maxsize=1)
+def _user_agent_provider():
+    """Shared fake-useragent instance; its UA database is loaded only once"""
+    if UserAgent is None:
+        return None
+    try:
+        return UserAgent()
+    except Exception:
+        return None
+
+
 def get_random_user_agent() -> str:
-    if UserAgent is not None:
+    provider = _user_agent_provider()
+    if provider is not None:
         try:
-            return UserAgent().random
+            return provider.random
         except Exception:
             pass
 
     return random.choice(FALLBACK_USER_AGENTS)
 
+
+def _run_coroutine_sync(coro):
+    """Run a coroutine to completion from sync code.
+
+    Falls back to a worker thread when this thread already runs an event
+    loop (Colab/Jupyter), where asyncio.run() would raise.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
 # ============================================================================
 # CELL 2: GOOGLE DRIVE MOUNT & DIRECTORY SETUP
 # ============================================================================
@@ -99,6 +151,7 @@ def get_random_user_agent() -> str:
 def setup_environment():
     """Mount Drive and create directories"""
     if IN_COLAB:
+        from google.colab import drive
         drive.mount('/content/drive', force_remount=False)
     
     # Create directory structure
@@ -298,6 +351,7 @@ CONFIG = {
         'test_before_use': True,
         'test_url': 'https://httpbin.org/ip',
         'test_timeout': 20,
+        'test_concurrency': 200,              # In-flight proxy tests (aiohttp path)
         'request_timeout': 15,        # Total timeout
         'connect_timeout': 10,        # Connection establishment
         'read_timeout': 10,           # Waiting for response
@@ -324,13 +378,19 @@ CONFIG = {
     'scraping': {
         'delay_min': 2.0,                     # Minimum delay between requests
         'delay_max': 6.0,                     # Maximum delay
+        'requests_per_second': None,          # Per-host rate; None = 1 / mean(delay_min, delay_max)
         'page_load_timeout': 30,
         'request_timeout': 20,
         'max_retries': 3,
         'retry_delay': 5,
         'scroll_pause': 1.5,                  # For infinite scroll pages
         'max_scroll_count': 10,
-        'concurrent_scrapers': 1,             # Keep 1 to avoid blocks
+        'concurrent_scrapers': 5,             # Sources scraped in parallel (each site is paced per host)
+        'search_workers': 4,                  # Parallel keyword x location searches per scraper
+        'browser_pool_size': 2,               # Warm Chrome drivers reused across searches
+        'pool_connections': 8,                # Per-host connection pools kept by urllib3
+        'pool_maxsize': 64,                   # Idle keep-alive sockets kept per host
+        'dns_cache_ttl': 300,                 # Seconds to reuse resolved addresses (0 = off)
         'randomize_order': True,              # Randomize keyword/location order
     },
 
@@ -388,7 +448,8 @@ CONFIG = {
         'console_level': 'INFO',
         'file_level': 'DEBUG',
         'log_file_prefix': 'scraper',
-        'max_log_files': 10,
+        'max_log_files': 10,               # Rotated backups kept (gzipped)
+        'max_log_bytes': 64 * 1024 * 1024, # Rotate the log file at this size
         'log_format': '%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s',
     },
     
@@ -596,7 +657,19 @@ def validate_config() -> Tuple[bool, List[str]]:
 # Description: Core data structures used throughout the application
 # ============================================================================
 
-@dataclass
+# Column order of the jobs table as written by DatabaseManager
+JOB_COLUMNS: Tuple[str, ...] = (
+    'id', 'title', 'company', 'location', 'source', 'url', 'salary',
+    'experience', 'description', 'skills', 'job_type', 'source_id',
+    'posted_date', 'deadline', 'keyword_matched', 'scraped_at',
+    'posted_to_telegram', 'telegram_message_id',
+)
+
+# Telegram MarkdownV2 reserved characters -> backslash-escaped
+_MD_TRANS = str.maketrans({c: '\\' + c for c in '_*[]()~`>#+-=|{}.!'})
+_MD_SPECIAL_RE = re.compile(r'[_*\[\]()~`>#+\-=|{}.!]')
+
+@dataclass(slots=True)
 class Job:
     """Unified job representation across all platforms"""
     id: str
@@ -617,26 +690,43 @@ class Job:
     scraped_at: datetime = field(default_factory=datetime.now)
     posted_to_telegram: bool = False
     telegram_message_id: Optional[int] = None
+    # Memoized to_telegram_message() output, see telegram_message
+    _telegram_message: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     @staticmethod
     def generate_id(title: str, company: str, source: str) -> str:
         """Generate unique ID from job attributes"""
         raw = f"{title.lower().strip()}|{company.lower().strip()}|{source}"
-        return hashlib.md5(raw.encode()).hexdigest()[:16]
+        # MD5 is kept so IDs stay stable across existing databases; it's a
+        # dedupe key, not a security primitive
+        return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()[:16]
+    
+    def _row(self) -> tuple:
+        """Database row in JOB_COLUMNS order (datetimes as ISO strings, skills as JSON)"""
+        return (
+            self.id, self.title, self.company, self.location, self.source, self.url,
+            self.salary, self.experience, self.description,
+            # Empty lists can't be bound by sqlite
+            json.dumps(self.skills) if self.skills else None,
+            self.job_type, self.source_id,
+            self.posted_date.isoformat() if self.posted_date else None,
+            self.deadline.isoformat() if self.deadline else None,
+            self.keyword_matched,
+            self.scraped_at.isoformat(),
+            self.posted_to_telegram,
+            self.telegram_message_id,
+        )
     
     def to_dict(self) -> dict:
         """Convert to dictionary"""
-        data = asdict(self)
-        # Convert datetime objects to strings
-        if self.posted_date:
-            data['posted_date'] = self.posted_date.isoformat()
-        if self.deadline:
-            data['deadline'] = self.deadline.isoformat()
-        data['scraped_at'] = self.scraped_at.isoformat()
-        # Convert skills list to JSON string
-        if self.skills:
-            data['skills'] = json.dumps(self.skills)
-        return data
+        return dict(zip(JOB_COLUMNS, self._row()))
+    
+    @property
+    def telegram_message(self) -> str:
+        """to_telegram_message(), built once per Job and reused on retries"""
+        if self._telegram_message is None:
+            self._telegram_message = self.to_telegram_message()
+        return self._telegram_message
     
     def to_telegram_message(self) -> str:
         """Format job for Telegram posting"""
@@ -646,27 +736,28 @@ class Job:
             'govt': '🏛'
         }
         
+        esc = self._escape_md
         lines = [
             f"🚨 NEW JOB ALERT {source_emoji.get(self.source, '💼')}",
             "",
-            f"💼 {self._escape_md(self.title)}",
-            f"🏢 {self._escape_md(self.company)}",
-            f"📍 {self._escape_md(self.location or 'Not specified')}",
+            f"💼 {esc(self.title)}",
+            f"🏢 {esc(self.company)}",
+            f"📍 {esc(self.location or 'Not specified')}",
         ]
         
         # Always show experience requirement prominently
         experience_text = self.experience if self.experience else 'Fresher \\/ 0\\-2 Years'
-        lines.append(f"⭐ *Experience*: {self._escape_md(experience_text)}")
+        lines.append(f"⭐ *Experience*: {esc(experience_text)}")
         
         if self.salary:
-            lines.append(f"💰 {self._escape_md(self.salary)}")
+            lines.append(f"💰 {esc(self.salary)}")
         if self.job_type:
-            lines.append(f"📝 {self._escape_md(self.job_type)}")
+            lines.append(f"📝 {esc(self.job_type)}")
         if self.deadline:
             lines.append(f"⏰ Deadline: {self.deadline.strftime('%d %b %Y')}")
         if self.skills and len(self.skills) > 0:
             skills_str = ', '.join(self.skills[:5])
-            lines.append(f"🛠 Skills: {self._escape_md(skills_str)}")
+            lines.append(f"🛠 Skills: {esc(skills_str)}")
         
         lines.extend([
             "",
@@ -682,12 +773,12 @@ class Job:
         """Escape Markdown special characters"""
         if not text:
             return ""
-        escape_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-        for char in escape_chars:
-            text = text.replace(char, f'\\{char}')
-        return text
+        # Most titles/companies need no escaping: one C-level scan, no copy
+        if not _MD_SPECIAL_RE.search(text):
+            return text
+        return text.translate(_MD_TRANS)
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingStats:
     """Track scraping run statistics"""
     start_time: datetime = field(default_factory=datetime.now)
@@ -739,7 +830,12 @@ class ScrapingStats:
         return f"{minutes}m {seconds}s"
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        """Flat dict of all fields, datetimes as ISO strings (JSON-safe)"""
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        data['start_time'] = self.start_time.isoformat()
+        if self.end_time:
+            data['end_time'] = self.end_time.isoformat()
+        return data
     
     def get_summary(self) -> str:
         return f"""
@@ -798,11 +894,50 @@ class BlockedError(ScraperError):
 # Logs are saved to Google Drive for persistence
 # ============================================================================
 
+class CompressingRotatingFileHandler(RotatingFileHandler):
+    """Size-rotated log file whose backups are gzipped on a background thread"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.namer = lambda name: name + '.gz'
+        self.rotator = self._rotate
+        self._pending = queue.Queue()
+        threading.Thread(
+            target=self._compress_worker, name='LogCompressor', daemon=True
+        ).start()
+    
+    def _rotate(self, source: str, dest: str):
+        """Rename synchronously, leave the gzip step to the worker"""
+        if not os.path.exists(source):
+            return
+        staging = dest[:-len('.gz')]
+        os.replace(source, staging)
+        self._pending.put((staging, dest))
+    
+    def _compress_worker(self):
+        while True:
+            staging, dest = self._pending.get()
+            try:
+                with open(staging, 'rb') as f_in, gzip.open(dest, 'wb') as f_out:
+                    shutil.copyfileobj(f_in, f_out)
+                os.remove(staging)
+            except OSError:
+                pass
+            finally:
+                self._pending.task_done()
+    
+    def close(self):
+        # Don't leave a half-written .gz behind at shutdown
+        self._pending.join()
+        super().close()
+
+
 class LogManager:
     """Centralized logging configuration"""
     
     _instance = None
     _initialized = False
+    _listener = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -827,42 +962,59 @@ class LogManager:
         console_handler = logging.StreamHandler()
         console_handler.setLevel(getattr(logging, CONFIG['logging']['console_level']))
         console_handler.setFormatter(logging.Formatter(log_format))
-        root_logger.addHandler(console_handler)
         
         # File handler
-        log_filename = f"{CONFIG['logging']['log_file_prefix']}_{datetime.now().strftime('%Y%m%d')}.log"
+        log_filename = f"{CONFIG['logging']['log_file_prefix']}.log"
         log_filepath = os.path.join(CONFIG['paths']['logs_dir'], log_filename)
-        
+        
         # Ensure log directory exists
-        log_dir = os.path.dirname(log_filepath)
-        os.makedirs(log_dir, exist_ok=True)
+        log_dir = os.path.dirname(log_filepath)
+        os.makedirs(log_dir, exist_ok=True)
         
-        file_handler = logging.FileHandler(log_filepath)
+        file_handler = CompressingRotatingFileHandler(
+            log_filepath,
+            maxBytes=CONFIG['logging'].get('max_log_bytes', 64 * 1024 * 1024),
+            backupCount=CONFIG['logging']['max_log_files'],
+        )
         file_handler.setLevel(getattr(logging, CONFIG['logging']['file_level']))
         file_handler.setFormatter(logging.Formatter(log_format))
-        root_logger.addHandler(file_handler)
+        
+        # Buffer file writes; flush every 1024 records or on the first ERROR
+        buffered_file_handler = MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler
+        )
+        buffered_file_handler.setLevel(file_handler.level)
+        
+        # Callers only enqueue records; a listener thread does the actual I/O
+        log_queue = queue.Queue(-1)
+        root_logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue, console_handler, buffered_file_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self.stop)
         
         self._initialized = True
         logging.info(f"Logging initialized. Log file: {log_filepath}")
     
+    def stop(self):
+        """Drain queued records and flush buffered file output"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            try:
+                handler.flush()
+            except (OSError, ValueError):
+                # Stream already closed at interpreter exit (same as logging.shutdown)
+                pass
+        self._listener = None
+    
     @staticmethod
     def get_logger(name: str) -> logging.Logger:
         """Get named logger"""
         return logging.getLogger(name)
-    
-    def cleanup_old_logs(self, keep_count: int = None):
-        """Remove old log files"""
-        keep_count = keep_count or CONFIG['logging']['max_log_files']
-        logs_dir = CONFIG['paths']['logs_dir']
-        
-        log_files = sorted([
-            f for f in os.listdir(logs_dir) 
-            if f.startswith(CONFIG['logging']['log_file_prefix']) and f.endswith('.log')
-        ], reverse=True)
-        
-        for old_log in log_files[keep_count:]:
-            os.remove(os.path.join(logs_dir, old_log))
-            logging.debug(f"Removed old log: {old_log}")
 
 
 # ============================================================================
@@ -875,6 +1027,53 @@ class LogManager:
 class DatabaseManager:
     """SQLite database management"""
     
+    _INSERT_SQL = (
+        f"INSERT OR IGNORE INTO jobs ({', '.join(JOB_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(JOB_COLUMNS))})"
+    )
+    
+    # Rows fetched per round-trip when streaming exports
+    _EXPORT_BATCH_SIZE = 5000
+    
+    # Rows inserted per transaction by save_jobs_bulk; bounds how long the write
+    # lock is held so other processes (CLI cleanup/export) can interleave
+    _WRITE_BATCH_SIZE = 500
+    
+    # Seconds a connection waits on another process's lock before "database is locked"
+    _BUSY_TIMEOUT = 30
+    
+    # Trigram FTS5 index over the searchable columns. Trigrams keep the substring
+    # semantics of the old LIKE '%q%' queries while letting SQLite use an index.
+    _FTS_SCHEMA = (
+        '''CREATE VIRTUAL TABLE jobs_fts USING fts5(
+               title, company, location,
+               content='jobs', content_rowid='rowid', tokenize='trigram'
+           )''',
+        '''CREATE TRIGGER IF NOT EXISTS jobs_fts_ai AFTER INSERT ON jobs BEGIN
+               INSERT INTO jobs_fts(rowid, title, company, location)
+               VALUES (new.rowid, new.title, new.company, new.location);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS jobs_fts_ad AFTER DELETE ON jobs BEGIN
+               INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+               VALUES ('delete', old.rowid, old.title, old.company, old.location);
+           END''',
+        '''CREATE TRIGGER IF NOT EXISTS jobs_fts_au AFTER UPDATE OF title, company, location ON jobs BEGIN
+               INSERT INTO jobs_fts(jobs_fts, rowid, title, company, location)
+               VALUES ('delete', old.rowid, old.title, old.company, old.location);
+               INSERT INTO jobs_fts(rowid, title, company, location)
+               VALUES (new.rowid, new.title, new.company, new.location);
+           END''',
+        "INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')",
+    )
+    
+    # Applied to every new connection (journal_mode=WAL persists in the file)
+    _CONNECTION_PRAGMAS = (
+        'PRAGMA synchronous=NORMAL',
+        'PRAGMA temp_store=MEMORY',
+        'PRAGMA mmap_size=268435456',
+        'PRAGMA cache_size=-65536',
+    )
+    
     def __init__(self):
         self.db_path = os.path.join(
             CONFIG['paths']['database_dir'],
@@ -882,23 +1081,48 @@ class DatabaseManager:
         )
         
         # Ensure database directory exists
-        db_dir = os.path.dirname(self.db_path)
-        os.makedirs(db_dir, exist_ok=True)
+        db_dir = os.path.dirname(self.db_path)
+        os.makedirs(db_dir, exist_ok=True)
         
         self.logger = LogManager.get_logger('DatabaseManager')
+        # Serializes writers; readers run concurrently under WAL
         self._lock = threading.Lock()
+        self._tls = threading.local()
+        # Every per-thread connection, so close() can reach the ones owned by workers
+        self._connections: List[sqlite3.Connection] = []
         self._init_db()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        """Get this thread's database connection (opened once, then reused)"""
+        conn = getattr(self._tls, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path, timeout=self._BUSY_TIMEOUT,
+                check_same_thread=False, cached_statements=256,
+            )
+            conn.row_factory = sqlite3.Row
+            for pragma in self._CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._tls.conn = conn
+            self._connections.append(conn)
         return conn
     
+    def close(self):
+        """Close every cached connection; later calls transparently reopen"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+            self._tls = threading.local()
+            for conn in connections:
+                try:
+                    conn.close()
+                except sqlite3.Error:
+                    pass
+    
     def _init_db(self):
         """Initialize database schema"""
         with self._lock:
             conn = self._get_connection()
+            conn.execute('PRAGMA journal_mode=WAL')
             cursor = conn.cursor()
             
             # Jobs table
@@ -928,11 +1152,20 @@ class DatabaseManager:
             ''')
             
             # Indexes
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_posted ON jobs(posted_to_telegram)')
+            # (source, posted_to_telegram, scraped_at) covers get_stats' grouped scan, so it
+            # reads only the index; it supersedes the old single-column source index
+            cursor.execute('DROP INDEX IF EXISTS idx_jobs_source')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_source_stats ON jobs(source, posted_to_telegram, scraped_at)')
+            # (posted_to_telegram, scraped_at DESC) serves get_unposted_jobs' filter and
+            # ORDER BY without a sort step; it supersedes the old single-column index
+            cursor.execute('DROP INDEX IF EXISTS idx_jobs_posted')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_unposted_recent ON jobs(posted_to_telegram, scraped_at DESC)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_scraped ON jobs(scraped_at)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company)')
             
+            # Full-text index for search; LIKE scans are the fallback without FTS5
+            self._fts_enabled = self._init_fts(conn)
+            
             # Scraping logs table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS scraping_logs (
@@ -972,116 +1205,175 @@ class DatabaseManager:
             ''')
             
             conn.commit()
-            conn.close()
-            self.logger.info(f"Database initialized at {self.db_path}")
+            
+            # In-memory dedupe index, kept in sync by the write paths below
+            self._known_ids: Set[str] = {row[0] for row in conn.execute('SELECT id FROM jobs')}
+            self.logger.info(f"Database initialized at {self.db_path} ({len(self._known_ids)} jobs)")
+    
+    def _init_fts(self, conn: sqlite3.Connection) -> bool:
+        """Create the jobs_fts index and its sync triggers, returns False if FTS5 is unavailable"""
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'jobs_fts'"
+        ).fetchone()
+        if exists:
+            # jobs.rowid isn't an INTEGER PRIMARY KEY alias, so VACUUM may renumber it
+            # and leave the index pointing at the wrong rows; check against jobs on open
+            try:
+                with conn:
+                    conn.execute("INSERT INTO jobs_fts(jobs_fts, rank) VALUES ('integrity-check', 1)")
+            except sqlite3.OperationalError as e:
+                self.logger.warning(f"FTS5 unavailable, search falls back to LIKE scans: {e}")
+                return False
+            except sqlite3.DatabaseError as e:
+                self.logger.warning(f"Rebuilding jobs_fts, out of sync with jobs: {e}")
+                with conn:
+                    conn.execute("INSERT INTO jobs_fts(jobs_fts) VALUES ('rebuild')")
+            return True
+        
+        try:
+            with conn:
+                for statement in self._FTS_SCHEMA:
+                    conn.execute(statement)
+        except sqlite3.OperationalError as e:
+            self.logger.warning(f"FTS5 unavailable, search falls back to LIKE scans: {e}")
+            return False
+        return True
+    
+    def _search(self, column: Optional[str], query: str, limit: Optional[int]) -> List[Job]:
+        """Substring search on one column (or title/company/location), newest first"""
+        limit_sql = ' LIMIT ?' if limit else ''
+        
+        # Trigrams need at least three characters to match anything
+        if self._fts_enabled and len(query) >= 3:
+            phrase = '"' + query.replace('"', '""') + '"'
+            match = f'{column} : {phrase}' if column else phrase
+            sql = (
+                'SELECT j.* FROM jobs j JOIN jobs_fts f ON f.rowid = j.rowid '
+                'WHERE jobs_fts MATCH ? ORDER BY j.scraped_at DESC' + limit_sql
+            )
+            params: List[Any] = [match]
+        else:
+            columns = [column] if column else ['title', 'company', 'location']
+            pattern = f'%{query}%'
+            sql = (
+                'SELECT * FROM jobs WHERE ' + ' OR '.join(f'{c} LIKE ?' for c in columns) +
+                ' ORDER BY scraped_at DESC' + limit_sql
+            )
+            params = [pattern] * len(columns)
+        
+        if limit:
+            params.append(limit)
+        cursor = self._get_connection().execute(sql, params)
+        return [self._row_to_job(row) for row in cursor.fetchall()]
+    
+    def search_jobs(self, query: str, limit: int = 50) -> List[Job]:
+        """Find jobs whose title, company or location contains query"""
+        return self._search(None, query, limit)
+    
+    def get_jobs_by_company(self, company: str) -> List[Job]:
+        """Find all jobs whose company contains the given name"""
+        return self._search('company', company, None)
     
     def job_exists(self, job_id: str) -> bool:
         """Check if job already exists"""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT 1 FROM jobs WHERE id = ?', (job_id,))
-            exists = cursor.fetchone() is not None
-            conn.close()
-            return exists
+        return job_id in self._known_ids
     
     def save_job(self, job: Job) -> bool:
         """Save single job, returns True if new"""
-        if self.job_exists(job.id):
+        if job.id in self._known_ids:
             return False
         
         with self._lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            data = job.to_dict()
-            columns = ', '.join(data.keys())
-            placeholders = ', '.join(['?' for _ in data])
-            
-            try:
-                cursor.execute(
-                    f'INSERT INTO jobs ({columns}) VALUES ({placeholders})',
-                    list(data.values())
-                )
-                conn.commit()
-                self.logger.debug(f"Saved job: {job.title} at {job.company}")
-                return True
-            except sqlite3.IntegrityError:
-                return False
-            finally:
-                conn.close()
+            with conn:
+                inserted = conn.execute(self._INSERT_SQL, job._row()).rowcount == 1
+            # Either new, or inserted by another process since startup
+            self._known_ids.add(job.id)
+        
+        if inserted:
+            self.logger.debug(f"Saved job: {job.title} at {job.company}")
+        return inserted
     
     def save_jobs(self, jobs: List[Job]) -> int:
-        """Save multiple jobs, returns count of new jobs"""
-        new_count = 0
-        for job in jobs:
-            if self.save_job(job):
-                new_count += 1
+        """Save multiple jobs in batched transactions, returns count of new jobs"""
+        new_count = sum(self.save_jobs_bulk(jobs).values())
         self.logger.info(f"Saved {new_count} new jobs out of {len(jobs)}")
         return new_count
     
-    def get_unposted_jobs(self, limit: int = 50) -> List[Job]:
-        """Get jobs not yet posted to Telegram"""
+    def save_jobs_bulk(self, jobs: List[Job]) -> Dict[str, int]:
+        """Save multiple jobs in batched transactions, returns count of new jobs per source"""
+        candidates = [job for job in jobs if job.id not in self._known_ids]
+        new_counts = dict.fromkeys((job.source for job in candidates), 0)
+        if not candidates:
+            return new_counts
+        
         with self._lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM jobs 
-                WHERE posted_to_telegram = 0 
-                ORDER BY scraped_at DESC 
-                LIMIT ?
-            ''', (limit,))
-            rows = cursor.fetchall()
-            conn.close()
-            
-            return [self._row_to_job(row) for row in rows]
+            for start in range(0, len(candidates), self._WRITE_BATCH_SIZE):
+                batch = candidates[start:start + self._WRITE_BATCH_SIZE]
+                rows_by_source: Dict[str, List[tuple]] = {}
+                for job in batch:
+                    rows_by_source.setdefault(job.source, []).append(job._row())
+                
+                with conn:
+                    for source, rows in rows_by_source.items():
+                        # rowcount, unlike total_changes, excludes the FTS trigger writes
+                        new_counts[source] += conn.executemany(self._INSERT_SQL, rows).rowcount
+                self._known_ids.update(job.id for job in batch)
+        
+        return new_counts
+    
+    def get_unposted_jobs(self, limit: int = 50) -> List[Job]:
+        """Get jobs not yet posted to Telegram"""
+        cursor = self._get_connection().execute('''
+            SELECT * FROM jobs 
+            WHERE posted_to_telegram = 0 
+            ORDER BY scraped_at DESC 
+            LIMIT ?
+        ''', (limit,))
+        return [self._row_to_job(row) for row in cursor.fetchall()]
     
     def mark_as_posted(self, job_id: str, message_id: int = None):
         """Mark job as posted to Telegram"""
+        self.mark_many_as_posted([(job_id, message_id)])
+    
+    def mark_many_as_posted(self, pairs: List[Tuple[str, Optional[int]]]):
+        """Mark several (job_id, message_id) pairs as posted in one transaction"""
+        if not pairs:
+            return
+        now = datetime.now().isoformat()
+        rows = [(message_id, now, job_id) for job_id, message_id in pairs]
+        
         with self._lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE jobs 
-                SET posted_to_telegram = 1, telegram_message_id = ?, updated_at = ?
-                WHERE id = ?
-            ''', (message_id, datetime.now().isoformat(), job_id))
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.executemany('''
+                    UPDATE jobs 
+                    SET posted_to_telegram = 1, telegram_message_id = ?, updated_at = ?
+                    WHERE id = ?
+                ''', rows)
     
     def get_stats(self) -> dict:
         """Get database statistics"""
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            
-            stats = {}
-            
-            # Total jobs
-            cursor.execute('SELECT COUNT(*) FROM jobs')
-            stats['total_jobs'] = cursor.fetchone()[0]
-            
-            # Jobs by source
-            cursor.execute('''
-                SELECT source, COUNT(*) as count 
-                FROM jobs GROUP BY source
-            ''')
-            stats['by_source'] = {row['source']: row['count'] for row in cursor.fetchall()}
-            
-            # Unposted jobs
-            cursor.execute('SELECT COUNT(*) FROM jobs WHERE posted_to_telegram = 0')
-            stats['unposted'] = cursor.fetchone()[0]
-            
-            # Jobs today
-            today = datetime.now().strftime('%Y-%m-%d')
-            cursor.execute('''
-                SELECT COUNT(*) FROM jobs 
-                WHERE scraped_at LIKE ?
-            ''', (f'{today}%',))
-            stats['today'] = cursor.fetchone()[0]
-            
-            conn.close()
-            return stats
+        today = datetime.now().strftime('%Y-%m-%d')
+        
+        # One grouped scan; every figure is reduced from its rows
+        cursor = self._get_connection().execute('''
+            SELECT source, posted_to_telegram, substr(scraped_at, 1, 10) = ? AS is_today,
+                   COUNT(*) AS count
+            FROM jobs GROUP BY 1, 2, 3
+        ''', (today,))
+        
+        stats = {'total_jobs': 0, 'by_source': {}, 'unposted': 0, 'today': 0}
+        for source, posted, is_today, count in cursor:
+            stats['total_jobs'] += count
+            stats['by_source'][source] = stats['by_source'].get(source, 0) + count
+            if not posted:
+                stats['unposted'] += count
+            if is_today:
+                stats['today'] += count
+        
+        return stats
     
     def cleanup_old_jobs(self, days: int = None):
         """Remove jobs older than specified days"""
@@ -1090,11 +1382,10 @@ class DatabaseManager:
         
         with self._lock:
             conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute('DELETE FROM jobs WHERE scraped_at < ?', (cutoff,))
-            deleted = cursor.rowcount
-            conn.commit()
-            conn.close()
+            with conn:
+                deleted = conn.execute('DELETE FROM jobs WHERE scraped_at < ?', (cutoff,)).rowcount
+            if deleted > 0:
+                self._known_ids = {row[0] for row in conn.execute('SELECT id FROM jobs')}
             
             if deleted > 0:
                 self.logger.info(f"Cleaned up {deleted} jobs older than {days} days")
@@ -1106,13 +1397,17 @@ class DatabaseManager:
             filename = f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             filepath = os.path.join(CONFIG['paths']['exports_dir'], filename)
         
-        with self._lock:
-            conn = self._get_connection()
-            df = pd.read_sql_query('SELECT * FROM jobs ORDER BY scraped_at DESC', conn)
-            conn.close()
+        cursor = self._get_connection().execute('SELECT * FROM jobs ORDER BY scraped_at DESC')
+        count = 0
+        
+        with open(filepath, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow([col[0] for col in cursor.description])
+            for rows in self._iter_batches(cursor):
+                writer.writerows(rows)
+                count += len(rows)
         
-        df.to_csv(filepath, index=False)
-        self.logger.info(f"Exported {len(df)} jobs to {filepath}")
+        self.logger.info(f"Exported {count} jobs to {filepath}")
         return filepath
     
     def export_to_json(self, filepath: str = None) -> str:
@@ -1121,21 +1416,37 @@ class DatabaseManager:
             filename = f"jobs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             filepath = os.path.join(CONFIG['paths']['exports_dir'], filename)
         
-        with self._lock:
-            conn = self._get_connection()
-            cursor = conn.cursor()
-            cursor.execute('SELECT * FROM jobs ORDER BY scraped_at DESC')
-            rows = cursor.fetchall()
-            conn.close()
+        cursor = self._get_connection().execute('SELECT * FROM jobs ORDER BY scraped_at DESC')
+        count = 0
         
-        jobs = [dict(row) for row in rows]
-        
-        with open(filepath, 'w') as f:
-            json.dump(jobs, f, indent=2, default=str)
-        
-        self.logger.info(f"Exported {len(jobs)} jobs to {filepath}")
+        if orjson is not None:
+            def dumps(obj) -> bytes:
+                return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            def dumps(obj) -> bytes:
+                return json.dumps(obj, indent=2, default=str).encode()
+        
+        # Stream the array one object at a time, laid out like json.dump(..., indent=2)
+        with open(filepath, 'wb') as f:
+            f.write(b'[')
+            for rows in self._iter_batches(cursor):
+                for row in rows:
+                    item = dumps(dict(row)).replace(b'\n', b'\n  ')
+                    f.write((b',\n  ' if count else b'\n  ') + item)
+                    count += 1
+            f.write(b'\n]' if count else b']')
+        
+        self.logger.info(f"Exported {count} jobs to {filepath}")
         return filepath
     
+    def _iter_batches(self, cursor):
+        """Yield fetchmany() batches until the cursor is exhausted"""
+        while True:
+            rows = cursor.fetchmany(self._EXPORT_BATCH_SIZE)
+            if not rows:
+                return
+            yield rows
+    
     def _row_to_job(self, row) -> Job:
         """Convert database row to Job object"""
         skills = None
@@ -1199,6 +1510,9 @@ class ProxyManager:
         'https://www.vpngate.net/api/iphone/',
     ]
     
+    # Rows of the first table on free-proxy-list style pages
+    _TABLE_ROWS_XPATH = etree.XPath('(//table)[1]//tr')
+    
     # Test URLs for different protocols
     TEST_URLS = {
         'http': 'http://httpbin.org/ip',
@@ -1216,10 +1530,20 @@ class ProxyManager:
         self._domain_blacklist: Dict[str, Set[str]] = {}  # domain -> set of proxies
         self._recovery_attempts: Dict[str, int] = {}
         self._ssl_failures: Set[str] = set()  # proxies that fail SSL
+        # Selectable proxies (working - blacklist - temp blacklist), maintained
+        # incrementally so get_proxy doesn't rebuild it on every call
+        self._available: List[str] = []
+        self._pos_in_available: Dict[str, int] = {}
         self._lock = threading.Lock()
         self._current_index = 0
         self._last_test_time: Optional[datetime] = None
         self._test_interval_hours = 6  # Re-test proxies every 6 hours
+        
+        # Shared keep-alive session for proxy-list fetches and proxy tests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
     
     def initialize(self) -> int:
         """Initialize proxy pool"""
@@ -1232,13 +1556,16 @@ class ProxyManager:
         
         # Fetch free proxies
         if CONFIG['proxy']['use_free_proxies']:
-            for source in self.FREE_PROXY_SOURCES:
-                try:
-                    proxies = self._fetch_from_source(source)
-                    self._proxies.extend(proxies)
-                    self.logger.debug(f"Fetched {len(proxies)} proxies from {source}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to fetch from {source}: {e}")
+            sources = self.FREE_PROXY_SOURCES
+            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = {executor.submit(self._fetch_from_source, source): source for source in sources}
+                for future, source in futures.items():
+                    try:
+                        proxies = future.result()
+                        self._proxies.extend(proxies)
+                        self.logger.debug(f"Fetched {len(proxies)} proxies from {source}")
+                    except Exception as e:
+                        self.logger.warning(f"Failed to fetch from {source}: {e}")
         
         # Remove duplicates
         self._proxies = list(set(self._proxies))
@@ -1249,6 +1576,9 @@ class ProxyManager:
         else:
             self._working_proxies = set(self._proxies)
         
+        with self._lock:
+            self._rebuild_available()
+        
         working_count = len(self._working_proxies)
         self.logger.info(f"Proxy pool ready: {working_count} working proxies")
         return working_count
@@ -1258,7 +1588,7 @@ class ProxyManager:
         proxies = []
         try:
             headers = {'User-Agent': get_random_user_agent()}
-            response = requests.get(url, headers=headers, timeout=15)
+            response = self._session.get(url, headers=headers, timeout=15)
             
             if 'vpngate.net' in url:
                 # Specialized parser for VPNGate format
@@ -1285,22 +1615,20 @@ class ProxyManager:
                 
                 self.logger.info(f"Extracted {len(proxies)} proxies from VPNGate")
             else:
-                # Original HTML parser
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # HTML table parser (lxml)
+                doc = lxml.html.fromstring(response.content)
                 
-                table = soup.find('table')
-                if table:
-                    for row in table.find_all('tr')[1:]:
-                        cols = row.find_all('td')
-                        if len(cols) >= 2:
-                            ip = cols[0].text.strip()
-                            port = cols[1].text.strip()
-                            # Prefer HTTPS proxies if configured
-                            https_col = cols[6] if len(cols) > 6 else None
-                            is_https = https_col and https_col.text.strip().lower() == 'yes'
-                            protocol = 'https' if (CONFIG['proxy']['prefer_https'] and is_https) else 'http'
-                            if ip and port:
-                                proxies.append(f"{protocol}://{ip}:{port}")
+                for row in self._TABLE_ROWS_XPATH(doc)[1:]:
+                    cols = row.findall('.//td')
+                    if len(cols) >= 2:
+                        ip = cols[0].text_content().strip()
+                        port = cols[1].text_content().strip()
+                        # Prefer HTTPS proxies if configured
+                        https_col = cols[6] if len(cols) > 6 else None
+                        is_https = https_col is not None and https_col.text_content().strip().lower() == 'yes'
+                        protocol = 'https' if (CONFIG['proxy']['prefer_https'] and is_https) else 'http'
+                        if ip and port:
+                            proxies.append(f"{protocol}://{ip}:{port}")
         except Exception as e:
             self.logger.debug(f"Error fetching proxies from {url}: {e}")
         
@@ -1312,21 +1640,18 @@ class ProxyManager:
         Returns (success, is_ssl_error).
         """
         try:
-            # Create a session that doesn't verify SSL (for testing)
-            session = requests.Session()
-            session.verify = False  # Disable SSL verification for testing
-            
-            # Test with HTTPS
-            response = session.get(
+            # Test with HTTPS, SSL verification disabled for this probe
+            response = self._session.get(
                 self.TEST_URLS['https'],
                 proxies={'http': proxy, 'https': proxy},
-                timeout=CONFIG['proxy']['test_timeout']
+                timeout=CONFIG['proxy']['test_timeout'],
+                verify=False
             )
             
             if response.status_code == 200:
                 # Try with SSL verification too
                 try:
-                    requests.get(
+                    self._session.get(
                         self.TEST_URLS['https'],
                         proxies={'http': proxy, 'https': proxy},
                         timeout=CONFIG['proxy']['test_timeout']
@@ -1346,41 +1671,91 @@ class ProxyManager:
         
         return False, False
     
+    async def _test_all_proxies_async(self) -> List[Optional[str]]:
+        """Test all proxies concurrently on a single event loop (aiohttp)"""
+        concurrency = CONFIG['proxy'].get('test_concurrency', 200)
+        semaphore = asyncio.Semaphore(concurrency)
+        timeout = aiohttp.ClientTimeout(total=CONFIG['proxy']['test_timeout'])
+        headers = {'User-Agent': get_random_user_agent()}
+        
+        async def test_one(session, proxy: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    # HTTPS first (certificate not verified for the probe), then HTTP
+                    async with session.get(self.TEST_URLS['https'], proxy=proxy, ssl=False) as response:
+                        if response.status != 200:
+                            return None
+                    async with session.get(self.TEST_URLS['http'], proxy=proxy) as response:
+                        return proxy if response.status == 200 else None
+                except Exception:
+                    return None
+        
+        connector = aiohttp.TCPConnector(limit=concurrency)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            return await asyncio.gather(*(test_one(session, p) for p in self._proxies))
+    
     def _test_all_proxies(self):
         """Test all proxies with HTTPS/SSL handling"""
         self.logger.info(f"Testing {len(self._proxies)} proxies...")
         
-        def test_one(proxy: str) -> Optional[str]:
-            try:
-                success, is_ssl_error = self._test_proxy_https(proxy)
+        if aiohttp is not None:
+            results = _run_coroutine_sync(self._test_all_proxies_async())
+        else:
+            # Thread-pool fallback when aiohttp isn't installed
+            def test_one(proxy: str) -> Optional[str]:
+                try:
+                    success, is_ssl_error = self._test_proxy_https(proxy)
                 
-                if success:
-                    # Test HTTP as well for completeness
-                    response = requests.get(
-                        self.TEST_URLS['http'],
-                        proxies={'http': proxy, 'https': proxy},
-                        timeout=CONFIG['proxy']['test_timeout']
-                    )
-                    if response.status_code == 200:
-                        return proxy
-            except:
-                pass
-            return None
+                    if success:
+                        # Test HTTP as well for completeness
+                        response = self._session.get(
+                            self.TEST_URLS['http'],
+                            proxies={'http': proxy, 'https': proxy},
+                            timeout=CONFIG['proxy']['test_timeout']
+                        )
+                        if response.status_code == 200:
+                            return proxy
+                except:
+                    pass
+                return None
         
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            results = list(executor.map(test_one, self._proxies))
+            with ThreadPoolExecutor(max_workers=20) as executor:
+                results = list(executor.map(test_one, self._proxies))
         
         self._working_proxies = set(p for p in results if p)
         self._last_test_time = datetime.now()
         self.logger.info(f"Found {len(self._working_proxies)} working proxies")
     
+    def _rebuild_available(self):
+        """Recompute the selectable list from scratch (call with lock held)"""
+        self._available = list(self._working_proxies - self._blacklist - self._temp_blacklist.keys())
+        self._pos_in_available = {p: i for i, p in enumerate(self._available)}
+    
+    def _add_available(self, proxy: str):
+        if proxy not in self._pos_in_available:
+            self._pos_in_available[proxy] = len(self._available)
+            self._available.append(proxy)
+    
+    def _remove_available(self, proxy: str):
+        """O(1) swap-remove from the selectable list"""
+        idx = self._pos_in_available.pop(proxy, None)
+        if idx is None:
+            return
+        last = self._available.pop()
+        if idx < len(self._available):
+            self._available[idx] = last
+            self._pos_in_available[last] = idx
+    
     def _cleanup_temp_blacklist(self):
         """Remove expired entries from temporary blacklist"""
         now = time.time()
-        expired = [p for p, unblock_at in self._temp_blacklist.items() if now >= unblock_at]
-        for p in expired:
-            self._temp_blacklist.pop(p, None)
-            self.logger.info(f"Proxy restored from temp blacklist: {p}")
+        with self._lock:
+            expired = [p for p, unblock_at in self._temp_blacklist.items() if now >= unblock_at]
+            for p in expired:
+                self._temp_blacklist.pop(p, None)
+                if p in self._working_proxies and p not in self._blacklist:
+                    self._add_available(p)
+                self.logger.info(f"Proxy restored from temp blacklist: {p}")
     
     def _get_backoff_delay(self, proxy: str, attempt: int) -> float:
         """Calculate exponential backoff delay"""
@@ -1403,30 +1778,40 @@ class ProxyManager:
         self._cleanup_temp_blacklist()
         
         with self._lock:
+            if not self._available:
+                self.logger.warning(f"No working proxies available for domain: {domain}")
+                return None
+            
             # Filter by domain blacklist
-            domain_excluded = self._domain_blacklist.get(domain, set()) if domain else set()
+            domain_excluded = self._domain_blacklist.get(domain) if domain else None
+            min_rate = CONFIG['proxy'].get('min_success_rate', 0.5)
             
-            available = list(self._working_proxies - self._blacklist - 
-                           set(self._temp_blacklist.keys()) - domain_excluded)
+            # Fast path: sample a few candidates and keep the better of the
+            # first two acceptable ones (power-of-two choices)
+            picked = []
+            for _ in range(8):
+                p = self._available[random.randrange(len(self._available))]
+                if domain_excluded and p in domain_excluded:
+                    continue
+                rate, total = self._success_rate(p)
+                if rate >= min_rate or total < 5:
+                    picked.append((rate, p))
+                    if len(picked) == 2:
+                        break
+            if picked:
+                return max(picked, key=lambda item: item[0])[1]
             
+            # Slow path: most of the pool is excluded or underperforming
+            available = [p for p in self._available if p not in domain_excluded] if domain_excluded else []
             if not available:
                 # Fallback to any working proxy if domain-specific ones are exhausted
-                available = list(self._working_proxies - self._blacklist - 
-                               set(self._temp_blacklist.keys()))
-            
-            if not available:
-                self.logger.warning(f"No working proxies available for domain: {domain}")
-                return None
+                available = self._available
             
             # Quality scoring and filtering
             scored_proxies = []
-            min_rate = CONFIG['proxy'].get('min_success_rate', 0.5)
             
             for p in available:
-                s = self._successes.get(p, 0)
-                f = self._failures.get(p, 0)
-                total = s + f
-                rate = s / total if total > 0 else 1.0
+                rate, total = self._success_rate(p)
                 
                 # Always allow proxies with few attempts to prove themselves
                 if rate >= min_rate or total < 5:
@@ -1440,17 +1825,36 @@ class ProxyManager:
             top_count = max(1, len(scored_proxies) // 3)
             return random.choice([p for p, _ in scored_proxies[:top_count]])
     
+    def _success_rate(self, proxy: str) -> Tuple[float, int]:
+        """Return (success rate, total attempts) for a proxy"""
+        s = self._successes.get(proxy, 0)
+        f = self._failures.get(proxy, 0)
+        total = s + f
+        return (s / total if total > 0 else 1.0), total
+    
     def report_success(self, proxy: str, domain: str = None):
         """Report successful proxy use"""
         with self._lock:
-            self._failures[proxy] = 0
-            self._successes[proxy] = self._successes.get(proxy, 0) + 1
-            self._working_proxies.add(proxy)
-            # Remove from temp blacklist and domain blacklist
-            self._temp_blacklist.pop(proxy, None)
-            self._ssl_failures.discard(proxy)
-            if domain and domain in self._domain_blacklist:
-                self._domain_blacklist[domain].discard(proxy)
+            self._apply_success(proxy, domain)
+    
+    def report_batch(self, successes: List[Tuple[str, Optional[str]]]):
+        """Report many (proxy, domain) successes under a single lock acquisition"""
+        with self._lock:
+            for proxy, domain in successes:
+                self._apply_success(proxy, domain)
+    
+    def _apply_success(self, proxy: str, domain: Optional[str]):
+        """Record one success (caller holds self._lock)"""
+        self._failures[proxy] = 0
+        self._successes[proxy] = self._successes.get(proxy, 0) + 1
+        self._working_proxies.add(proxy)
+        # Remove from temp blacklist and domain blacklist
+        self._temp_blacklist.pop(proxy, None)
+        if proxy not in self._blacklist:
+            self._add_available(proxy)
+        self._ssl_failures.discard(proxy)
+        if domain and domain in self._domain_blacklist:
+            self._domain_blacklist[domain].discard(proxy)
     
     def report_failure(self, proxy: str, domain: str = None, error: str = None):
         """
@@ -1489,6 +1893,7 @@ class ProxyManager:
                 recovery_time = CONFIG['proxy'].get('recovery_time', 300)
                 self._temp_blacklist[proxy] = time.time() + recovery_time
                 self._working_proxies.discard(proxy)
+                self._remove_available(proxy)
                 
                 # Check recovery limit
                 self._recovery_attempts[proxy] = self._recovery_attempts.get(proxy, 0) + 1
@@ -1501,7 +1906,7 @@ class ProxyManager:
     def get_working_count(self) -> int:
         """Get count of working proxies"""
         self._cleanup_temp_blacklist()
-        return len(self._working_proxies - self._blacklist - set(self._temp_blacklist.keys()))
+        return len(self._available)
     
     def get_stats(self) -> dict:
         """Get proxy statistics with SSL failure tracking"""
@@ -1535,16 +1940,17 @@ class FingerprintGenerator:
         'en-IN,en;q=0.9,hi;q=0.8',
     ]
     
+    # Prebuilt (chrome, mobile) header sets, filled on first get_random()
+    _PREBUILT: Optional[Tuple[Tuple[dict, ...], Tuple[dict, ...]]] = None
+    
     @classmethod
-    def generate_chrome_fingerprint(cls) -> dict:
+    def generate_chrome_fingerprint(cls, version: str = None, language: str = None) -> dict:
         """Generate Chrome-like headers"""
-        version = random.choice(cls.CHROME_VERSIONS)
+        version = version or random.choice(cls.CHROME_VERSIONS)
         return {
             'User-Agent': f'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{version} Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': random.choice(cls.ACCEPT_LANGUAGE),
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
+            'Accept-Language': language or random.choice(cls.ACCEPT_LANGUAGE),
             'Upgrade-Insecure-Requests': '1',
             'Sec-Ch-Ua': f'"Chromium";v="{version.split(".")[0]}", "Google Chrome";v="{version.split(".")[0]}"',
             'Sec-Ch-Ua-Mobile': '?0',
@@ -1562,17 +1968,22 @@ class FingerprintGenerator:
             'User-Agent': 'Mozilla/5.0 (Linux; Android 13; SM-G991B) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
         }
     
     @classmethod
     def get_random(cls) -> dict:
-        """Get random fingerprint"""
-        return random.choice([
-            cls.generate_chrome_fingerprint,
-            cls.generate_mobile_fingerprint,
-        ])()
+        """Get random fingerprint (a copy of a prebuilt header set)"""
+        if cls._PREBUILT is None:
+            cls._PREBUILT = (
+                tuple(
+                    cls.generate_chrome_fingerprint(version, language)
+                    for version in cls.CHROME_VERSIONS
+                    for language in cls.ACCEPT_LANGUAGE
+                ),
+                (cls.generate_mobile_fingerprint(),),
+            )
+        # Pick the browser family first so chrome and mobile stay equally likely
+        return dict(random.choice(random.choice(cls._PREBUILT)))
 
 
 # ============================================================================
@@ -1582,15 +1993,235 @@ class FingerprintGenerator:
 # Handles all HTTP requests with automatic retries and exponential backoff
 # ============================================================================
 
+# LRU order, least recently used first; bounded at _DNS_CACHE_SIZE lookups
+_dns_cache: 'OrderedDict[tuple, Tuple[float, list]]' = OrderedDict()
+_dns_cache_lock = threading.Lock()
+_dns_cache_ttl = 0.0
+_DNS_CACHE_SIZE = 256
+_orig_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo with a TTL/LRU cache; failed lookups are never cached"""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    with _dns_cache_lock:
+        entry = _dns_cache.get(key)
+        if entry is not None and entry[0] > now:
+            _dns_cache.move_to_end(key)
+            return entry[1]
+    result = _orig_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        _dns_cache[key] = (now + _dns_cache_ttl, result)
+        _dns_cache.move_to_end(key)
+        while len(_dns_cache) > _DNS_CACHE_SIZE:
+            _dns_cache.popitem(last=False)
+    return result
+
+
+def install_dns_cache(ttl: float) -> None:
+    """Route process-wide name resolution through the TTL cache (ttl <= 0 disables)"""
+    global _dns_cache_ttl
+    _dns_cache_ttl = float(ttl)
+    if _dns_cache_ttl > 0:
+        socket.getaddrinfo = _cached_getaddrinfo
+    elif socket.getaddrinfo is _cached_getaddrinfo:
+        socket.getaddrinfo = _orig_getaddrinfo
+        with _dns_cache_lock:
+            _dns_cache.clear()
+
+
+_URL_HOST_END_RE = re.compile(r'[/?#]')
+
+
+def _url_host(url: str) -> Optional[str]:
+    """Host[:port] of an http(s) URL, or None (the per-host pacing and proxy-stats key)"""
+    scheme, sep, rest = url.partition('://')
+    if not sep or scheme.lower() not in ('http', 'https'):
+        return None
+    end = _URL_HOST_END_RE.search(rest)
+    return (rest[:end.start()] if end else rest) or None
+
+
+@lru_cache(maxsize=None)
+def _class_xpath(tag: str, class_name: Optional[str] = None) -> etree.XPath:
+    """Compiled XPath for descendant <tag> elements, optionally carrying a CSS class"""
+    if not class_name:
+        return etree.XPath(f'.//{tag}')
+    return etree.XPath(
+        f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+    )
+
+
+def _find_first(elem, tag: str, class_name: Optional[str] = None):
+    """First descendant matching tag/class, or None (like bs4's find())"""
+    found = _class_xpath(tag, class_name)(elem)
+    return found[0] if found else None
+
+
+_TEXT_NODES_XPATH = etree.XPath('.//text()')
+
+
+def _node_text(elem) -> str:
+    """Concatenated stripped text of an element (like bs4's get_text(strip=True))"""
+    return ''.join(text.strip() for text in _TEXT_NODES_XPATH(elem))
+
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _strip_html(fragment: str) -> str:
+    """Plain text of a small HTML snippet: tags dropped, entities decoded, whitespace collapsed"""
+    return ' '.join(html.unescape(_TAG_RE.sub(' ', fragment)).split())
+
+
+def _fragment_text(fragment: str) -> str:
+    """Text of an HTML snippet, as bs4's get_text(strip=True) would return it"""
+    return _node_text(lxml.html.fragment_fromstring(fragment, create_parent='div'))
+
+
+# lxml parsers must not be shared between threads; keep one per encoding per thread
+_HTML_PARSERS = threading.local()
+
+
+def _html_parser(encoding: str) -> lxml.html.HTMLParser:
+    """This thread's reusable HTMLParser for the given encoding"""
+    parsers = getattr(_HTML_PARSERS, 'by_encoding', None)
+    if parsers is None:
+        parsers = _HTML_PARSERS.by_encoding = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml.html.HTMLParser(encoding=encoding)
+    return parser
+
+
+def _parse_html(content, encoding: Optional[str] = None):
+    """Parse an HTML document or fragment into an lxml tree"""
+    if isinstance(content, bytes):
+        parser = _html_parser((encoding or 'utf-8').lower())
+        return lxml.html.document_fromstring(content, parser=parser)
+    return lxml.html.document_fromstring(content)
+
+
+# Feed summaries are only ever flattened to text, so skip feedparser's HTML
+# sanitizer and relative-URI rewriting passes
+_FEEDPARSER_OPTIONS = {'sanitize_html': False, 'resolve_relative_uris': False}
+
+
+# Statuses worth retrying; other 4xx (404 on an empty search, 403 blocks) fail fast
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+
+def _should_retry(error: BaseException) -> bool:
+    """Retry connection errors, timeouts, and transient HTTP statuses only"""
+    if isinstance(error, requests.HTTPError):
+        response = error.response
+        return response is not None and response.status_code in _RETRYABLE_STATUS
+    return isinstance(error, (requests.Timeout, requests.ConnectionError))
+
+
+class TokenBucket:
+    """Thread-safe token bucket; acquire() only sleeps when no token is available"""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self) -> float:
+        """Take one token without blocking, returns seconds until it is due"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A negative balance reserves a future slot for this caller
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+    
+    def acquire(self):
+        """Take one token, sleeping until it is due if the bucket is empty"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
 class HTTPClient:
     """HTTP client with retry, proxy rotation, SSL handling, and fingerprint spoofing"""
     
+    # Proxy successes are buffered and reported to ProxyManager in batches of this size
+    PROXY_REPORT_BATCH = 32
+    
     def __init__(self, proxy_manager: ProxyManager):
         self.proxy_manager = proxy_manager
         self.logger = LogManager.get_logger('HTTPClient')
         self.session = requests.Session()
         # Configure session to handle SSL issues gracefully
         self.session.verify = True  # Can be set to False for problematic proxies
+        
+        # Pool keep-alive sockets per host; retries are handled by tenacity, not urllib3
+        scraping = CONFIG.get('scraping', {})
+        install_dns_cache(scraping.get('dns_cache_ttl', 300))
+        adapter = HTTPAdapter(
+            pool_connections=scraping.get('pool_connections', 8),
+            pool_maxsize=scraping.get('pool_maxsize', 64),
+            max_retries=0,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Transport headers are session-wide; fingerprints only vary identity headers.
+        # Only advertise encodings urllib3 can actually decode here.
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': ACCEPT_ENCODING,
+        })
+        
+        # Per-host request pacing shared by all scraper threads
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._buckets_lock = threading.Lock()
+        
+        # Pending (proxy, domain) successes; failures are reported immediately
+        self._pending_successes: deque = deque()
+    
+    def _report_proxy_success(self, proxy: str, domain: Optional[str]):
+        """Buffer a proxy success, flushing once a full batch is pending"""
+        self._pending_successes.append((proxy, domain))
+        if len(self._pending_successes) >= self.PROXY_REPORT_BATCH:
+            self.flush_proxy_reports()
+    
+    def _report_proxy_failure(self, proxy: str, domain: Optional[str], error: str):
+        """Report a proxy failure after any older buffered successes"""
+        self.flush_proxy_reports()
+        self.proxy_manager.report_failure(proxy, domain=domain, error=error)
+    
+    def flush_proxy_reports(self):
+        """Apply buffered proxy successes to the ProxyManager"""
+        batch = []
+        while True:
+            try:
+                batch.append(self._pending_successes.popleft())
+            except IndexError:
+                break
+        if batch:
+            self.proxy_manager.report_batch(batch)
+    
+    def _get_bucket(self, host: str) -> Optional[TokenBucket]:
+        """Token bucket for a host (None when pacing is disabled)"""
+        bucket = self._buckets.get(host)
+        if bucket is not None:
+            return bucket
+        
+        scraping = CONFIG['scraping']
+        rate = scraping.get('requests_per_second')
+        if not rate:
+            mean_delay = (scraping['delay_min'] + scraping['delay_max']) / 2
+            if mean_delay <= 0:
+                return None
+            rate = 1.0 / mean_delay
+        
+        with self._buckets_lock:
+            return self._buckets.setdefault(host, TokenBucket(rate))
     
     def _detect_ssl_error(self, error: Exception) -> bool:
         """Detect if error is SSL-related"""
@@ -1601,7 +2232,7 @@ class HTTPClient:
     @retry(
         stop=stop_after_attempt(5),
         wait=wait_exponential(multiplier=1, min=2, max=30),
-        retry=(retry_if_exception_type((requests.Timeout, requests.ConnectionError, requests.HTTPError))),
+        retry=retry_if_exception(_should_retry),
         reraise=True
     )
     def get(self, url: str, allow_ssl_bypass: bool = None, **kwargs) -> requests.Response:
@@ -1621,8 +2252,7 @@ class HTTPClient:
         headers.update(kwargs.pop('headers', {}))
         
         # Domain context for proxy tracking
-        domain_match = re.findall(r'https?://([^/]+)', url)
-        domain = domain_match[0] if domain_match else None
+        domain = _url_host(url)
         
         # Add proxy
         proxy = self.proxy_manager.get_proxy(domain=domain)
@@ -1638,10 +2268,9 @@ class HTTPClient:
                 self.proxy_manager._failures.get(proxy, 0))
             time.sleep(delay)
         else:
-            time.sleep(random.uniform(
-                CONFIG['scraping']['delay_min'],
-                CONFIG['scraping']['delay_max']
-            ))
+            bucket = self._get_bucket(domain)
+            if bucket is not None:
+                bucket.acquire()
         
         try:
             response = self.session.get(
@@ -1656,18 +2285,18 @@ class HTTPClient:
             if response.status_code in [429, 503]:
                 self.logger.warning(f"Server returned {response.status_code} for {url}")
                 if proxy:
-                    self.proxy_manager.report_failure(proxy, domain=domain, error=f"HTTP {response.status_code}")
+                    self._report_proxy_failure(proxy, domain, f"HTTP {response.status_code}")
                 response.raise_for_status() # Trigger retry
                 
             if proxy:
-                self.proxy_manager.report_success(proxy, domain=domain)
+                self._report_proxy_success(proxy, domain)
             
             response.raise_for_status()
             return response
             
         except requests.RequestException as e:
             if proxy:
-                self.proxy_manager.report_failure(proxy, domain=domain, error=str(e))
+                self._report_proxy_failure(proxy, domain, str(e))
             
             # If SSL error and allowed, retry with SSL verification disabled
             if self._detect_ssl_error(e) and allow_ssl_bypass:
@@ -1679,10 +2308,20 @@ class HTTPClient:
             self.logger.warning(f"Request failed: {url} - {e}")
             raise
     
-    def get_soup(self, url: str, **kwargs) -> BeautifulSoup:
+    def get_soup(self, url: str, **kwargs) -> 'BeautifulSoup':
         """Get BeautifulSoup object from URL"""
+        # Only legacy callers want soup; keep bs4 off the import path otherwise
+        from bs4 import BeautifulSoup
+        
+        response = self.get(url, **kwargs)
+        # Hand lxml the raw bytes; response.text would run charset detection
+        # whenever the server omits a charset
+        return BeautifulSoup(response.content, 'lxml', from_encoding=response.encoding)
+    
+    def get_dom(self, url: str, **kwargs) -> lxml.html.HtmlElement:
+        """Get an lxml document from URL (much cheaper to build and query than soup)"""
         response = self.get(url, **kwargs)
-        return BeautifulSoup(response.text, 'lxml')
+        return _parse_html(response.content, response.encoding)
     
     def get_json(self, url: str, **kwargs) -> dict:
         """Get JSON response from URL"""
@@ -1697,13 +2336,72 @@ class HTTPClient:
 # Used for JavaScript-heavy pages and login flows
 # ============================================================================
 
+# Anti-detection Chrome flags applied to every driver
+_BASE_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-extensions',
+    '--disable-gpu',
+    '--window-size=1920,1080',
+)
+
+# Scrolls to the bottom every interval ms until the page height stops growing
+# for 3 rounds (or max_rounds is hit), then reports the number of rounds
+_SCROLL_TO_END_JS = '''
+    const done = arguments[arguments.length - 1];
+    const maxRounds = arguments[0];
+    const interval = arguments[1];
+    let last = -1, unchanged = 0, rounds = 0;
+    const timer = setInterval(() => {
+        window.scrollTo(0, document.body.scrollHeight);
+        const height = document.body.scrollHeight;
+        rounds += 1;
+        if (height === last) {
+            unchanged += 1;
+        } else {
+            unchanged = 0;
+            last = height;
+        }
+        if (unchanged > 2 || rounds >= maxRounds) {
+            clearInterval(timer);
+            done(rounds);
+        }
+    }, interval);
+'''
+
+# Stealth patches injected into every new document
+_STEALTH_JS = '''
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [1, 2, 3, 4, 5]
+    });
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+'''
+
+
 class BrowserManager:
     """Browser automation with anti-detection"""
     
+    # chromedriver path resolved once per process by ChromeDriverManager
+    _DRIVER_PATH: Optional[str] = None
+    _DRIVER_PATH_LOCK = threading.Lock()
+    
     def __init__(self, proxy_manager: ProxyManager):
         self.proxy_manager = proxy_manager
         self.logger = LogManager.get_logger('BrowserManager')
         self._drivers: List[webdriver.Chrome] = []
+        # Pool of idle drivers handed out by acquire()/release()
+        self.pool_size = max(1, int(CONFIG['scraping'].get('browser_pool_size', 2) or 1))
+        self._pool: queue.Queue = queue.Queue()
+        self._pool_created = 0
+        self._pool_lock = threading.Lock()
+        # Long-lived drivers owned by one scraper each, see get_or_create()
+        self._named: Dict[str, webdriver.Chrome] = {}
     
     def get_selenium_driver(
         self, 
@@ -1718,13 +2416,9 @@ class BrowserManager:
             options.add_argument('--headless=new')
         
         # Anti-detection settings
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-gpu')
-        options.add_argument('--window-size=1920,1080')
-        options.add_argument(f'--user-agent={UserAgent().random}')
+        for arg in _BASE_ARGS:
+            options.add_argument(arg)
+        options.add_argument(f'--user-agent={get_random_user_agent()}')
         
         # Disable automation flags
         options.add_experimental_option('excludeSwitches', ['enable-automation'])
@@ -1734,28 +2428,17 @@ class BrowserManager:
         if proxy:
             options.add_argument(f'--proxy-server={proxy}')
         
-        # Create driver
+        # Create driver; keep_alive reuses one HTTP connection to chromedriver for
+        # every command (each driver is only used by one thread at a time)
         try:
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=options)
+            service = Service(self._get_driver_path())
+            driver = webdriver.Chrome(service=service, options=options, keep_alive=True)
         except:
             # Fallback for Colab
-            driver = webdriver.Chrome(options=options)
+            driver = webdriver.Chrome(options=options, keep_alive=True)
         
         # Apply stealth patches
-        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {
-            'source': '''
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [1, 2, 3, 4, 5]
-                });
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-            '''
-        })
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': _STEALTH_JS})
         
         driver.set_page_load_timeout(CONFIG['scraping']['page_load_timeout'])
         
@@ -1763,6 +2446,83 @@ class BrowserManager:
         self.logger.debug("Created new Selenium driver")
         return driver
     
+    @classmethod
+    def _get_driver_path(cls) -> str:
+        """Install/locate chromedriver on first use and reuse the path afterwards"""
+        if cls._DRIVER_PATH is None:
+            with cls._DRIVER_PATH_LOCK:
+                if cls._DRIVER_PATH is None:
+                    cls._DRIVER_PATH = ChromeDriverManager().install()
+        return cls._DRIVER_PATH
+    
+    def get_or_create(self, name: str, headless: bool = True) -> webdriver.Chrome:
+        """Return the cached driver for name, starting a new one if missing or its session died"""
+        with self._pool_lock:
+            driver = self._named.get(name)
+        
+        if driver is not None:
+            try:
+                if driver.session_id is not None:
+                    driver.current_url  # round-trip to confirm the browser is alive
+                    return driver
+            except WebDriverException as e:
+                self.logger.info(f"Recreating '{name}' driver after lost session: {e}")
+            self._discard(driver)
+        
+        driver = self.get_selenium_driver(headless=headless)
+        with self._pool_lock:
+            self._named[name] = driver
+        return driver
+    
+    def _discard(self, driver: webdriver.Chrome):
+        """Quit a driver and forget it"""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._pool_lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+            for name, cached in list(self._named.items()):
+                if cached is driver:
+                    del self._named[name]
+    
+    def acquire(self, timeout: float = None) -> webdriver.Chrome:
+        """Borrow a pooled driver, starting a new one while the pool is below pool_size"""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._pool_lock:
+            create = self._pool_created < self.pool_size
+            if create:
+                self._pool_created += 1
+        
+        if not create:
+            return self._pool.get(timeout=timeout)
+        
+        try:
+            return self.get_selenium_driver()
+        except Exception:
+            with self._pool_lock:
+                self._pool_created -= 1
+            raise
+    
+    def release(self, driver: webdriver.Chrome, discard: bool = False):
+        """Return a driver to the pool with its cookies cleared, or quit it if discard is set"""
+        if not discard:
+            try:
+                driver.delete_all_cookies()
+                self._pool.put(driver)
+                return
+            except Exception as e:
+                self.logger.debug(f"Discarding pooled driver: {e}")
+        
+        self._discard(driver)
+        with self._pool_lock:
+            self._pool_created -= 1
+    
     def human_scroll(self, driver, times: int = 5, pause: float = None):
         """Scroll page like a human"""
         pause = pause or CONFIG['scraping']['scroll_pause']
@@ -1772,6 +2532,20 @@ class BrowserManager:
             driver.execute_script(f"window.scrollBy(0, {scroll_amount})")
             time.sleep(pause + random.uniform(0, 0.5))
     
+    def scroll_to_end(self, driver, max_rounds: int = None, interval: float = 0.4) -> int:
+        """Scroll an infinite-scroll page to its end in one async script call
+        
+        Falls back to human_scroll if the script is blocked or times out.
+        """
+        max_rounds = max_rounds or CONFIG['scraping']['max_scroll_count']
+        try:
+            driver.set_script_timeout(max_rounds * interval + 10)
+            return driver.execute_async_script(_SCROLL_TO_END_JS, max_rounds, int(interval * 1000))
+        except WebDriverException as e:
+            self.logger.debug(f"Scripted scroll failed, scrolling manually: {e}")
+            self.human_scroll(driver, times=max_rounds)
+            return max_rounds
+    
     def human_type(self, element, text: str, min_delay: float = 0.05, max_delay: float = 0.15):
         """Type text with human-like delays"""
         for char in text:
@@ -1817,6 +2591,10 @@ class BrowserManager:
             except:
                 pass
         self._drivers = []
+        with self._pool_lock:
+            self._pool = queue.Queue()
+            self._pool_created = 0
+            self._named.clear()
         self.logger.debug("All browser drivers closed")
 
 
@@ -1827,6 +2605,55 @@ class BrowserManager:
 # Provides common functionality for filtering and validation
 # ============================================================================
 
+def _compile_keywords(keywords) -> Optional[re.Pattern]:
+    """Compile keywords into one case-insensitive substring regex (None if empty)"""
+    keywords = [kw.lower() for kw in keywords or []]
+    if not keywords:
+        return None
+    # Longest first so overlapping alternatives do not shadow each other
+    keywords.sort(key=len, reverse=True)
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Title indicators that a job is not fresher-level
+_NON_FRESHER_RE = _compile_keywords([
+    'experienced', 'expert', 'professional', 'specialist',
+    '3 years', '4 years', '5 years', '6 years', '7 years',
+    '3+ yrs', '4+ yrs', '5+ yrs',
+])
+
+# Years figure of experience requirements like "3-5 years", "3+ yrs" or "3 years+".
+# The lookahead holds both shapes, so one scan finds every figure either would.
+_EXPERIENCE_YEARS_RE = re.compile(r'(\d+)(?=\s*[-+]\s*\d*\s*y|\s*ye?a?r?s?\s*[-+])')
+
+# Indian cities, states, and keywords
+_INDIA_LOCATION_RE = _compile_keywords([
+    'india', 'delhi', 'mumbai', 'bangalore', 'bengaluru', 'hyderabad', 
+    'pune', 'chennai', 'kolkata', 'ahmedabad', 'surat', 'jaipur',
+    'lucknow', 'kanpur', 'nagpur', 'indore', 'thane', 'bhopal',
+    'visakhapatnam', 'pimpri', 'patna', 'vadodara', 'ghaziabad',
+    'ludhiana', 'agra', 'nashik', 'faridabad', 'meerut', 'rajkot',
+    'varanasi', 'srinagar', 'aurangabad', 'dhanbad', 'amritsar',
+    'navi mumbai', 'allahabad', 'ranchi', 'howrah', 'coimbatore',
+    'jabalpur', 'gwalior', 'vijayawada', 'jodhpur', 'madurai',
+    'raipur', 'kota', 'chandigarh', 'gurgaon', 'gurugram', 'noida',
+    'kochi', 'thiruvananthapuram', 'mysore', 'bhubaneswar',
+    'remote india', 'work from home india', 'wfh india',
+    # States
+    'maharashtra', 'karnataka', 'tamil nadu', 'telangana', 'kerala',
+    'gujarat', 'rajasthan', 'uttar pradesh', 'west bengal', 'haryana',
+    'madhya pradesh', 'punjab', 'odisha', 'andhra pradesh',
+])
+
+# Explicit non-India locations to exclude
+_NON_INDIA_LOCATION_RE = _compile_keywords([
+    'usa', 'united states', 'uk', 'united kingdom', 'canada',
+    'australia', 'singapore', 'dubai', 'uae', 'germany', 'france',
+    'netherlands', 'switzerland', 'new york', 'london', 'toronto',
+    'sydney', 'melbourne', 'europe', 'asia pacific', 'apac',
+])
+
+
 class BaseScraper(ABC):
     """Abstract base class for job scrapers"""
     
@@ -1845,12 +2672,57 @@ class BaseScraper(ABC):
         self.telegram = telegram_poster
         self.logger = LogManager.get_logger(self.__class__.__name__)
         self.stats = {'found': 0, 'new': 0, 'errors': 0}
+        self._stats_lock = threading.Lock()
+        
+        # Configured exclusion lists, compiled once per scraper
+        filters = CONFIG['filters']
+        self._exclude_company_re = _compile_keywords(filters.get('exclude_companies'))
+        self._exclude_title_re = _compile_keywords(filters.get('exclude_title_keywords'))
     
     @abstractmethod
     def scrape_all(self) -> List[Job]:
         """Main scraping method - must be implemented"""
         pass
     
+    def _incr_stat(self, key: str, amount: int = 1):
+        """Thread-safe increment of a stats counter"""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    def _iter_searches(self, search, keywords: List[str], locations: List[str], workers: int = None):
+        """Run search(keyword, location) for every pair, yielding (keyword, location, jobs, error).
+        
+        Searches run on a bounded thread pool and are yielded as they complete.
+        With a single worker they run lazily in order. If the caller stops
+        iterating, searches that have not started yet are cancelled.
+        """
+        pairs = [(keyword, location) for keyword in keywords for location in locations]
+        if workers is None:
+            workers = int(CONFIG['scraping'].get('search_workers', 1) or 1)
+        workers = max(1, min(workers, len(pairs)))
+        
+        if workers == 1:
+            for keyword, location in pairs:
+                try:
+                    jobs, error = search(keyword, location), None
+                except Exception as e:
+                    jobs, error = None, e
+                yield keyword, location, jobs, error
+            return
+        
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=self.__class__.__name__)
+        try:
+            futures = {executor.submit(search, keyword, location): (keyword, location) for keyword, location in pairs}
+            for future in as_completed(futures):
+                keyword, location = futures[future]
+                try:
+                    jobs, error = future.result(), None
+                except Exception as e:
+                    jobs, error = None, e
+                yield keyword, location, jobs, error
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+    
     def validate_job(self, job: Job) -> bool:
         """Validate job has required fields"""
         if not job.title or not job.company:
@@ -1861,97 +2733,89 @@ class BaseScraper(ABC):
     
     def apply_filters(self, job: Job) -> bool:
         """Apply configured filters"""
+        return self._passes_filters(job.title, job.company, job.location, job.experience)
+    
+    def _passes_filters(
+        self,
+        title: str,
+        company: str,
+        location: Optional[str],
+        experience: Optional[str] = None,
+    ) -> bool:
+        """Apply configured filters to raw job fields"""
         filters = CONFIG['filters']
         
+        title_lower = title.lower()
+        
         # Exclude companies
-        if filters['exclude_companies']:
-            if any(exc.lower() in job.company.lower() for exc in filters['exclude_companies']):
-                self.logger.debug(f"Filtered out (company): {job.company}")
-                return False
+        if self._exclude_company_re and self._exclude_company_re.search(company.lower()):
+            self.logger.debug(f"Filtered out (company): {company}")
+            return False
         
         # Exclude title keywords
-        if filters['exclude_title_keywords']:
-            title_lower = job.title.lower()
-            if any(kw.lower() in title_lower for kw in filters['exclude_title_keywords']):
-                self.logger.debug(f"Filtered out (title): {job.title}")
-                return False
+        if self._exclude_title_re and self._exclude_title_re.search(title_lower):
+            self.logger.debug(f"Filtered out (title): {title}")
+            return False
         
         # FRESHER ONLY MODE - Strict filtering for entry-level/fresher jobs only
         if filters.get('fresher_only_mode', False):
-            title_lower = job.title.lower()
-            experience_lower = (job.experience or '').lower()
+            experience_lower = (experience or '').lower()
             
             # Check if experience explicitly mentions > 2 years
-            if job.experience:
-                # Look for patterns like "3+ years", "4-5 years", "5 years", etc.
-                exp_patterns = [
-                    r'(\d+)\s*[-+]\s*(\d+)?\s*ye?a?r?s?',  # Matches "3-5 years", "3+ years", "3 years"
-                    r'(\d+)\s*ye?a?r?s?\s*[-+]',  # Matches "3 years+"
-                ]
-                for pattern in exp_patterns:
-                    matches = re.findall(pattern, experience_lower)
-                    for match in matches:
-                        # Get the first number in the match
-                        try:
-                            years = int(match[0]) if match[0] else 0
-                            if years > 2:
-                                self.logger.debug(f"Filtered out (experience > 2 years): {job.title} - {job.experience}")
-                                return False
-                        except (ValueError, IndexError):
-                            pass
+            if experience:
+                for match in _EXPERIENCE_YEARS_RE.finditer(experience_lower):
+                    if int(match.group(1)) > 2:
+                        self.logger.debug(f"Filtered out (experience > 2 years): {title} - {experience}")
+                        return False
             
             # Additional title-based filtering for fresher mode
-            non_fresher_indicators = [
-                'experienced', 'expert', 'professional', 'specialist',
-                '3 years', '4 years', '5 years', '6 years', '7 years',
-                '3+ yrs', '4+ yrs', '5+ yrs',
-            ]
-            if any(indicator in title_lower for indicator in non_fresher_indicators):
-                self.logger.debug(f"Filtered out (non-fresher indicator): {job.title}")
+            if _NON_FRESHER_RE.search(title_lower):
+                self.logger.debug(f"Filtered out (non-fresher indicator): {title}")
                 return False
         
         # INDIA ONLY MODE - Filter out non-India locations
         if filters.get('india_only_mode', False):
-            if job.location:
-                location_lower = job.location.lower()
-                
-                # List of Indian cities, states, and keywords
-                india_keywords = [
-                    'india', 'delhi', 'mumbai', 'bangalore', 'bengaluru', 'hyderabad', 
-                    'pune', 'chennai', 'kolkata', 'ahmedabad', 'surat', 'jaipur',
-                    'lucknow', 'kanpur', 'nagpur', 'indore', 'thane', 'bhopal',
-                    'visakhapatnam', 'pimpri', 'patna', 'vadodara', 'ghaziabad',
-                    'ludhiana', 'agra', 'nashik', 'faridabad', 'meerut', 'rajkot',
-                    'varanasi', 'srinagar', 'aurangabad', 'dhanbad', 'amritsar',
-                    'navi mumbai', 'allahabad', 'ranchi', 'howrah', 'coimbatore',
-                    'jabalpur', 'gwalior', 'vijayawada', 'jodhpur', 'madurai',
-                    'raipur', 'kota', 'chandigarh', 'gurgaon', 'gurugram', 'noida',
-                    'kochi', 'thiruvananthapuram', 'mysore', 'bhubaneswar',
-                    'remote india', 'work from home india', 'wfh india',
-                    # States
-                    'maharashtra', 'karnataka', 'tamil nadu', 'telangana', 'kerala',
-                    'gujarat', 'rajasthan', 'uttar pradesh', 'west bengal', 'haryana',
-                    'madhya pradesh', 'punjab', 'odisha', 'andhra pradesh',
-                ]
-                
-                # Check if any India keyword is in the location
-                is_india_location = any(keyword in location_lower for keyword in india_keywords)
-                
-                # Also check for explicit non-India locations to exclude
-                non_india_keywords = [
-                    'usa', 'united states', 'uk', 'united kingdom', 'canada',
-                    'australia', 'singapore', 'dubai', 'uae', 'germany', 'france',
-                    'netherlands', 'switzerland', 'new york', 'london', 'toronto',
-                    'sydney', 'melbourne', 'europe', 'asia pacific', 'apac',
-                ]
-                has_non_india = any(keyword in location_lower for keyword in non_india_keywords)
+            if location:
+                location_lower = location.lower()
+                is_india_location = _INDIA_LOCATION_RE.search(location_lower) is not None
+                has_non_india = _NON_INDIA_LOCATION_RE.search(location_lower) is not None
                 
                 if has_non_india or not is_india_location:
-                    self.logger.debug(f"Filtered out (non-India location): {job.location}")
+                    self.logger.debug(f"Filtered out (non-India location): {location}")
                     return False
         
         return True
     
+    def _maybe_build_job(
+        self,
+        title: str,
+        company: str,
+        location: str,
+        url: str,
+        source: str,
+        keyword: str = "",
+        **extra,
+    ) -> Optional[Job]:
+        """Build a Job only if it has the required fields and passes the filters.
+        
+        Validation and filtering run on the raw strings, so rejected cards
+        never pay for the Job allocation or its id hash.
+        """
+        if not title or not company or not url:
+            return None
+        if not self._passes_filters(title, company, location, extra.get('experience')):
+            return None
+        return Job(
+            id=Job.generate_id(title, company, source),
+            title=title,
+            company=company,
+            location=location,
+            source=source,
+            url=url,
+            keyword_matched=keyword,
+            **extra,
+        )
+    
     def get_stats(self) -> dict:
         """Get scraper statistics"""
         return self.stats.copy()
@@ -2040,36 +2904,40 @@ class LinkedInScraper(BaseScraper):
             random.shuffle(keywords)
             random.shuffle(locations)
         
-        for keyword in keywords:
-            for location in locations:
-                if self._circuit_breaker_until > time.time():
+        def search(keyword: str, location: str) -> List[Job]:
+            if self._circuit_breaker_until > time.time():
+                return []
+            
+            self.logger.info(f"Scraping LinkedIn: '{keyword}' in '{location}'")
+            
+            # Add randomized delay between searches
+            search_delay = random.uniform(
+                CONFIG['linkedin'].get('request_delay_min', 2) * 2,
+                CONFIG['linkedin'].get('request_delay_max', 5) * 2
+            )
+            time.sleep(search_delay)
+            
+            return self._scrape_public_api(keyword, location)
+        
+        for keyword, location, jobs, error in self._iter_searches(search, keywords, locations):
+            if error is not None:
+                self.logger.error(f"LinkedIn scrape error: {error}")
+                self._incr_stat('errors')
+                continue
+            
+            all_jobs.extend(jobs)
+            self._incr_stat('found', len(jobs))
+            
+            if self._circuit_breaker_until > time.time():
+                break
+            
+            if not jobs:
+                self._consecutive_empty_results += 1
+                if self._consecutive_empty_results >= 3:
+                    self._trigger_circuit_breaker()
                     break
-                    
-                try:
-                    self.logger.info(f"Scraping LinkedIn: '{keyword}' in '{location}'")
-                    
-                    # Add randomized delay between searches
-                    search_delay = random.uniform(
-                        CONFIG['linkedin'].get('request_delay_min', 2) * 2,
-                        CONFIG['linkedin'].get('request_delay_max', 5) * 2
-                    )
-                    time.sleep(search_delay)
-                    
-                    jobs = self._scrape_public_api(keyword, location)
-                    
-                    if not jobs:
-                        self._consecutive_empty_results += 1
-                        if self._consecutive_empty_results >= 3:
-                            self._trigger_circuit_breaker()
-                            break
-                    else:
-                        self._consecutive_empty_results = 0
-                        
-                    all_jobs.extend(jobs)
-                    self.stats['found'] += len(jobs)
-                except Exception as e:
-                    self.logger.error(f"LinkedIn scrape error: {e}")
-                    self.stats['errors'] += 1
+            else:
+                self._consecutive_empty_results = 0
         
         return all_jobs
 
@@ -2085,16 +2953,16 @@ class LinkedInScraper(BaseScraper):
         max_results = CONFIG['linkedin']['max_results_per_search']
         page_size = 25
         
+        # Only 'start' changes between pages, so encode the rest once
+        base_qs = urlencode({
+            'keywords': keyword,
+            'location': location,
+            'f_E': ','.join(map(str, CONFIG['linkedin']['experience_levels'])),
+            'f_TPR': CONFIG['linkedin']['time_posted'],
+        })
+        
         while start < max_results:
-            params = {
-                'keywords': keyword,
-                'location': location,
-                'f_E': ','.join(map(str, CONFIG['linkedin']['experience_levels'])),
-                'f_TPR': CONFIG['linkedin']['time_posted'],
-                'start': start,
-            }
-            
-            url = f"{self.BASE_URL}?{urlencode(params)}"
+            url = f"{self.BASE_URL}?{base_qs}&start={start}"
             
             try:
                 response = self.http.get(url)
@@ -2106,10 +2974,10 @@ class LinkedInScraper(BaseScraper):
                     self._trigger_circuit_breaker(60) # Pause for 1 hour
                     break
                 
-                soup = BeautifulSoup(response.text, 'lxml')
+                dom = _parse_html(response.content, response.encoding)
                 
                 # Try each selector combination
-                cards = self._find_cards_with_fallbacks(soup)
+                cards = self._find_cards_with_fallbacks(dom)
                 
                 if not cards:
                     # Log diagnostic info when no cards found
@@ -2119,11 +2987,11 @@ class LinkedInScraper(BaseScraper):
                     )
                     
                     # Log HTML structure for debugging (first 500 chars)
-                    html_sample = str(soup)[:500]
+                    html_sample = response.text[:500]
                     self.logger.debug(f"HTML sample: {html_sample}")
                     
                     # Try to find any list-like structure
-                    all_links = soup.find_all('a')
+                    all_links = _class_xpath('a')(dom)
                     self.logger.debug(f"Total links in response: {len(all_links)}")
                     
                     break
@@ -2131,7 +2999,7 @@ class LinkedInScraper(BaseScraper):
                 for card in cards:
                     try:
                         job = self._parse_card_with_fallbacks(card, keyword)
-                        if job and self.validate_job(job) and self.apply_filters(job):
+                        if job:
                             jobs.append(job)
                     except Exception as e:
                         self.logger.debug(f"Failed to parse card: {e}")
@@ -2150,13 +3018,10 @@ class LinkedInScraper(BaseScraper):
         self.logger.info(f"Found {len(jobs)} LinkedIn jobs for '{keyword}'")
         return jobs
     
-    def _find_cards_with_fallbacks(self, soup: BeautifulSoup) -> List:
+    def _find_cards_with_fallbacks(self, dom: lxml.html.HtmlElement) -> List:
         """Find job cards using multiple CSS selector fallbacks"""
         for tag, class_name in self.CARD_SELECTORS:
-            if class_name:
-                cards = soup.find_all(tag, class_=class_name)
-            else:
-                cards = soup.find_all(tag)
+            cards = _class_xpath(tag, class_name)(dom)
             
             if cards:
                 self.logger.debug(f"Found {len(cards)} cards using selector ({tag}, {class_name})")
@@ -2167,12 +3032,9 @@ class LinkedInScraper(BaseScraper):
     def _find_element_with_fallbacks(self, parent, selectors: List[Tuple[str, Optional[str]]]) -> Optional:
         """Find an element using multiple selector fallbacks"""
         for tag, class_name in selectors:
-            if class_name:
-                elem = parent.find(tag, class_=class_name)
-            else:
-                elem = parent.find(tag)
+            elem = _find_first(parent, tag, class_name)
             
-            if elem:
+            if elem is not None:
                 return elem
         
         return None
@@ -2186,18 +3048,18 @@ class LinkedInScraper(BaseScraper):
             location_elem = self._find_element_with_fallbacks(card, self.LOCATION_SELECTORS)
             link_elem = self._find_element_with_fallbacks(card, self.LINK_SELECTORS)
             
-            if not all([title_elem, link_elem]):
+            if title_elem is None or link_elem is None:
                 # Log diagnostic info
                 self.logger.debug(
-                    f"Missing required elements - title: {bool(title_elem)}, "
-                    f"link: {bool(link_elem)}, company: {bool(company_elem)}, "
-                    f"location: {bool(location_elem)}"
+                    f"Missing required elements - title: {title_elem is not None}, "
+                    f"link: {link_elem is not None}, company: {company_elem is not None}, "
+                    f"location: {location_elem is not None}"
                 )
                 return None
             
-            title = title_elem.get_text(strip=True)
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-            location = location_elem.get_text(strip=True) if location_elem else ""
+            title = _node_text(title_elem)
+            company = _node_text(company_elem) if company_elem is not None else "Unknown"
+            location = _node_text(location_elem) if location_elem is not None else ""
             url = link_elem.get('href', '').split('?')[0]
             
             if not title or not url:
@@ -2207,15 +3069,9 @@ class LinkedInScraper(BaseScraper):
             # Get job ID from URL
             source_id = url.split('-')[-1] if url else None
             
-            return Job(
-                id=Job.generate_id(title, company, 'linkedin'),
-                title=title,
-                company=company,
-                location=location,
-                source='linkedin',
+            return self._maybe_build_job(
+                title, company, location, url, 'linkedin', keyword,
                 source_id=source_id,
-                url=url,
-                keyword_matched=keyword,
             )
         except Exception as e:
             self.logger.debug(f"Parse error: {e}")
@@ -2234,6 +3090,20 @@ class IndeedScraper(BaseScraper):
     
     RSS_URL = "https://www.indeed.com/rss"
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Job URLs already seen this run; the same posting recurs across keyword/location searches
+        self._seen_urls: Set[str] = set()
+        self._seen_lock = threading.Lock()
+    
+    def _first_sighting(self, url: str) -> bool:
+        """True the first time a job URL is seen in this run"""
+        with self._seen_lock:
+            if url in self._seen_urls:
+                return False
+            self._seen_urls.add(url)
+            return True
+    
     def scrape_all(self) -> List[Job]:
         """Scrape all configured Indeed searches (with fail-fast early-exit logic)"""
         if not CONFIG['indeed']['enabled']:
@@ -2246,69 +3116,63 @@ class IndeedScraper(BaseScraper):
         error_threshold = int(early_cfg.get('error_threshold', 3) or 3)
 
         all_jobs: List[Job] = []
-        keywords = list(CONFIG['indeed']['keywords'])
-        locations = list(CONFIG['indeed']['locations'])
-
-        if CONFIG['scraping']['randomize_order']:
-            random.shuffle(keywords)
-            random.shuffle(locations)
-
-        successful_location_checks = 0
-        total_jobs_found = 0
-        consecutive_errors = 0
-        aborted = False
-
-        for keyword in keywords:
-            if aborted:
-                break
-
-            for location in locations:
-                try:
-                    self.logger.info(f"Scraping Indeed: '{keyword}' in '{location}'")
-
-                    if CONFIG['indeed']['use_rss']:
-                        jobs = self._scrape_via_rss(keyword, location)
-                    else:
-                        jobs = self._scrape_via_web(keyword, location)
-
-                    consecutive_errors = 0
-                    successful_location_checks += 1
-                    total_jobs_found += len(jobs)
+        keywords = list(CONFIG['indeed']['keywords'])
+        locations = list(CONFIG['indeed']['locations'])
 
-                    all_jobs.extend(jobs)
-                    self.stats['found'] += len(jobs)
+        if CONFIG['scraping']['randomize_order']:
+            random.shuffle(keywords)
+            random.shuffle(locations)
 
-                    # Fail-fast: if we have checked N locations and still have zero jobs, stop.
-                    if early_enabled and total_jobs_found == 0 and successful_location_checks >= zero_threshold:
-                        self.logger.warning(
-                            f"⚠️ No Indeed jobs found after checking {successful_location_checks} locations, skipping remaining locations/keywords"
+        successful_location_checks = 0
+        total_jobs_found = 0
+        consecutive_errors = 0
+        with self._seen_lock:
+            self._seen_urls.clear()
+
+        def search(keyword: str, location: str) -> List[Job]:
+            self.logger.info(f"Scraping Indeed: '{keyword}' in '{location}'")
+            if CONFIG['indeed']['use_rss']:
+                return self._scrape_via_rss(keyword, location)
+            return self._scrape_via_web(keyword, location)
+
+        for keyword, location, jobs, e in self._iter_searches(search, keywords, locations):
+            if e is not None:
+                consecutive_errors += 1
+                self._incr_stat('errors')
+                self.logger.error(f"❌ Indeed scrape error ({type(e).__name__}): {e}")
+
+                if early_enabled and consecutive_errors >= error_threshold:
+                    self.logger.error(
+                        f"❌ Indeed returning persistent errors ({consecutive_errors} consecutive) - exiting scraper"
+                    )
+                    if self.telegram:
+                        self.telegram.send_scraper_alert(
+                            'Indeed',
+                            f"Persistent errors ({type(e).__name__}) - skipping to other sources",
+                            severity='warning',
                         )
-                        if self.telegram:
-                            self.telegram.send_scraper_alert(
-                                'Indeed',
-                                f"No jobs found for '{keyword}' after checking {successful_location_checks} locations - skipping to other sources",
-                                severity='error',
-                            )
-                        aborted = True
-                        break
+                    break
+                continue
 
-                except Exception as e:
-                    consecutive_errors += 1
-                    self.stats['errors'] += 1
-                    self.logger.error(f"❌ Indeed scrape error ({type(e).__name__}): {e}")
+            consecutive_errors = 0
+            successful_location_checks += 1
+            total_jobs_found += len(jobs)
 
-                    if early_enabled and consecutive_errors >= error_threshold:
-                        self.logger.error(
-                            f"❌ Indeed returning persistent errors ({consecutive_errors} consecutive) - exiting scraper"
-                        )
-                        if self.telegram:
-                            self.telegram.send_scraper_alert(
-                                'Indeed',
-                                f"Persistent errors ({type(e).__name__}) - skipping to other sources",
-                                severity='warning',
-                            )
-                        aborted = True
-                        break
+            all_jobs.extend(jobs)
+            self._incr_stat('found', len(jobs))
+
+            # Fail-fast: if we have checked N locations and still have zero jobs, stop.
+            if early_enabled and total_jobs_found == 0 and successful_location_checks >= zero_threshold:
+                self.logger.warning(
+                    f"⚠️ No Indeed jobs found after checking {successful_location_checks} locations, skipping remaining locations/keywords"
+                )
+                if self.telegram:
+                    self.telegram.send_scraper_alert(
+                        'Indeed',
+                        f"No jobs found for '{keyword}' after checking {successful_location_checks} locations - skipping to other sources",
+                        severity='error',
+                    )
+                break
 
         return all_jobs
     
@@ -2326,12 +3190,14 @@ class IndeedScraper(BaseScraper):
         url = f"{self.RSS_URL}?{urlencode(params)}"
         
         try:
-            feed = feedparser.parse(url)
+            # Fetch through the pooled session (proxy, pacing, retries); feedparser only parses
+            response = self.http.get(url)
+            feed = feedparser.parse(response.content, **_FEEDPARSER_OPTIONS)
             
             for entry in feed.entries[:CONFIG['indeed']['max_results_per_search']]:
                 try:
                     job = self._parse_rss_item(entry, keyword)
-                    if job and self.validate_job(job) and self.apply_filters(job):
+                    if job:
                         jobs.append(job)
                 except Exception as e:
                     self.logger.debug(f"Failed to parse RSS item: {e}")
@@ -2360,22 +3226,17 @@ class IndeedScraper(BaseScraper):
                 location = ""
             
             url = entry.get('link', '')
+            if url and not self._first_sighting(url):
+                return None
             
             # Extract description snippet
             description = ""
             if 'summary' in entry:
-                soup = BeautifulSoup(entry.summary, 'html.parser')
-                description = soup.get_text(strip=True)[:500]
+                description = _strip_html(entry.summary)[:500]
             
-            return Job(
-                id=Job.generate_id(job_title, company, 'indeed'),
-                title=job_title,
-                company=company,
-                location=location,
-                source='indeed',
-                url=url,
+            return self._maybe_build_job(
+                job_title, company, location, url, 'indeed', keyword,
                 description=description,
-                keyword_matched=keyword,
             )
         except Exception as e:
             self.logger.debug(f"RSS parse error: {e}")
@@ -2393,13 +3254,13 @@ class IndeedScraper(BaseScraper):
         }
         
         try:
-            soup = self.http.get_soup(f"{base_url}?{urlencode(params)}")
-            cards = soup.find_all('div', class_='job_seen_beacon')
+            dom = self.http.get_dom(f"{base_url}?{urlencode(params)}")
+            cards = _class_xpath('div', 'job_seen_beacon')(dom)
             
             for card in cards[:CONFIG['indeed']['max_results_per_search']]:
                 try:
                     job = self._parse_web_card(card, keyword)
-                    if job and self.validate_job(job) and self.apply_filters(job):
+                    if job:
                         jobs.append(job)
                 except Exception as e:
                     self.logger.debug(f"Failed to parse web card: {e}")
@@ -2412,29 +3273,23 @@ class IndeedScraper(BaseScraper):
     def _parse_web_card(self, card, keyword: str) -> Optional[Job]:
         """Parse web page job card"""
         try:
-            title_elem = card.find('h2', class_='jobTitle')
-            company_elem = card.find('span', {'data-testid': 'company-name'})
-            location_elem = card.find('div', {'data-testid': 'text-location'})
+            title_elem = _find_first(card, 'h2', 'jobTitle')
+            company_elem = _find_first(card, "span[@data-testid='company-name']")
+            location_elem = _find_first(card, "div[@data-testid='text-location']")
             
-            if not title_elem:
+            if title_elem is None:
                 return None
             
-            title = title_elem.get_text(strip=True)
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-            location = location_elem.get_text(strip=True) if location_elem else ""
+            link = _find_first(title_elem, 'a')
+            url = f"https://www.indeed.com{link.get('href', '')}" if link is not None else ""
+            if url and not self._first_sighting(url):
+                return None
             
-            link = title_elem.find('a')
-            url = f"https://www.indeed.com{link.get('href', '')}" if link else ""
+            title = _node_text(title_elem)
+            company = _node_text(company_elem) if company_elem is not None else "Unknown"
+            location = _node_text(location_elem) if location_elem is not None else ""
             
-            return Job(
-                id=Job.generate_id(title, company, 'indeed'),
-                title=title,
-                company=company,
-                location=location,
-                source='indeed',
-                url=url,
-                keyword_matched=keyword,
-            )
+            return self._maybe_build_job(title, company, location, url, 'indeed', keyword)
         except Exception as e:
             self.logger.debug(f"Web card parse error: {e}")
             return None
@@ -2452,12 +3307,23 @@ class NaukriScraper(BaseScraper):
     
     API_URL = "https://www.naukri.com/jobapi/v3/search"
     
+    # Desktop User-Agents rotated on API requests
+    DESKTOP_USER_AGENTS = (
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+    )
+    
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        # Initialize session for connection reuse
-        self.session = requests.Session() if CONFIG.get('naukri', {}).get('session_enabled', True) else None
-        if self.session:
-            self.session.headers.update({'User-Agent': self._get_random_user_agent()})
+        # Reuse HTTPClient's pooled keep-alive session (headers are set per request)
+        self.session = self.http.session if CONFIG.get('naukri', {}).get('session_enabled', True) else None
+        # Retry attempt numbers are tracked per search thread
+        self._retry_local = threading.local()
     
     def scrape_all(self) -> List[Job]:
         """Scrape all configured Naukri searches (with fail-fast early-exit logic)"""
@@ -2481,76 +3347,64 @@ class NaukriScraper(BaseScraper):
         successful_location_checks = 0
         total_jobs_found = 0
         consecutive_errors = 0
-        aborted = False
 
-        for keyword in keywords:
-            if aborted:
-                break
+        use_api = CONFIG['naukri']['use_api']
 
-            for location in locations:
-                try:
-                    self.logger.info(f"📡 Naukri Request: {keyword} in {location}")
+        def search(keyword: str, location: str) -> List[Job]:
+            self.logger.info(f"📡 Naukri Request: {keyword} in {location}")
+            if use_api:
+                return self._scrape_via_api(keyword, location)
+            return self._scrape_via_selenium(keyword, location)
 
-                    if CONFIG['naukri']['use_api']:
-                        jobs = self._scrape_via_api(keyword, location)
-                    else:
-                        jobs = self._scrape_via_selenium(keyword, location)
+        # The Selenium path can only run as many searches as there are pooled browsers
+        workers = None if use_api else self.browser.pool_size
 
-                    consecutive_errors = 0
-                    successful_location_checks += 1
-                    total_jobs_found += len(jobs)
+        for keyword, location, jobs, e in self._iter_searches(search, keywords, locations, workers):
+            if e is not None:
+                consecutive_errors += 1
+                self._incr_stat('errors')
 
-                    all_jobs.extend(jobs)
-                    self.stats['found'] += len(jobs)
-                    self.logger.info(f"   ✅ Found {len(jobs)} Naukri jobs for '{keyword}' in '{location}'")
+                details = self._summarize_exception(e)
+                self.logger.error(f"   ❌ Naukri scrape error ({consecutive_errors} consecutive): {details}")
 
-                    if early_enabled and total_jobs_found == 0 and successful_location_checks >= zero_threshold:
-                        self.logger.warning(
-                            f"⚠️ No Naukri jobs found after checking {successful_location_checks} locations, skipping remaining locations/keywords"
+                if early_enabled and consecutive_errors >= error_threshold:
+                    self.logger.error(
+                        f"❌ Naukri API returning persistent errors ({consecutive_errors} consecutive) - exiting scraper"
+                    )
+                    if self.telegram:
+                        self.telegram.send_scraper_alert(
+                            'Naukri',
+                            f"API unavailable ({details}) - will retry later",
+                            severity='warning',
                         )
-                        if self.telegram:
-                            self.telegram.send_scraper_alert(
-                                'Naukri',
-                                f"No jobs found for '{keyword}' after checking {successful_location_checks} locations - skipping to other sources",
-                                severity='error',
-                            )
-                        aborted = True
-                        break
+                    break
+                continue
 
-                except Exception as e:
-                    consecutive_errors += 1
-                    self.stats['errors'] += 1
+            consecutive_errors = 0
+            successful_location_checks += 1
+            total_jobs_found += len(jobs)
 
-                    details = self._summarize_exception(e)
-                    self.logger.error(f"   ❌ Naukri scrape error ({consecutive_errors} consecutive): {details}")
+            all_jobs.extend(jobs)
+            self._incr_stat('found', len(jobs))
+            self.logger.info(f"   ✅ Found {len(jobs)} Naukri jobs for '{keyword}' in '{location}'")
 
-                    if early_enabled and consecutive_errors >= error_threshold:
-                        self.logger.error(
-                            f"❌ Naukri API returning persistent errors ({consecutive_errors} consecutive) - exiting scraper"
-                        )
-                        if self.telegram:
-                            self.telegram.send_scraper_alert(
-                                'Naukri',
-                                f"API unavailable ({details}) - will retry later",
-                                severity='warning',
-                            )
-                        aborted = True
-                        break
+            if early_enabled and total_jobs_found == 0 and successful_location_checks >= zero_threshold:
+                self.logger.warning(
+                    f"⚠️ No Naukri jobs found after checking {successful_location_checks} locations, skipping remaining locations/keywords"
+                )
+                if self.telegram:
+                    self.telegram.send_scraper_alert(
+                        'Naukri',
+                        f"No jobs found for '{keyword}' after checking {successful_location_checks} locations - skipping to other sources",
+                        severity='error',
+                    )
+                break
 
         return all_jobs
     
     def _get_random_user_agent(self) -> str:
         """Get random desktop User-Agent for rotation"""
-        user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.1 Safari/605.1.15',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-        ]
-        return random.choice(user_agents)
+        return random.choice(self.DESKTOP_USER_AGENTS)
     
     def _get_api_headers(self) -> dict:
         """Get realistic browser headers with variation"""
@@ -2563,7 +3417,6 @@ class NaukriScraper(BaseScraper):
         
         headers = {
             'Accept': 'application/json, text/plain, */*',
-            'Accept-Encoding': 'gzip, deflate, br',
             'Accept-Language': random.choice(accept_languages),
             'User-Agent': self._get_random_user_agent(),
             'Client-Device': 'desktop',
@@ -2571,7 +3424,6 @@ class NaukriScraper(BaseScraper):
             'Sec-Fetch-Dest': 'empty',
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-origin',
-            'Connection': 'keep-alive',
             'Cache-Control': 'no-cache',
             'Pragma': 'no-cache',
         }
@@ -2650,7 +3502,7 @@ class NaukriScraper(BaseScraper):
         if CONFIG['naukri'].get('log_level', 'DEBUG') != 'DEBUG' and not self.logger.isEnabledFor(logging.DEBUG):
             return
 
-        attempt = getattr(self, '_naukri_retry_attempt', 1)
+        attempt = getattr(self._retry_local, 'attempt', 1)
         max_attempts = int(CONFIG['naukri'].get('max_retries', 3) or 3)
 
         safe_headers = self._sanitize_headers(headers)
@@ -2687,7 +3539,7 @@ class NaukriScraper(BaseScraper):
     def _before_attempt(retry_state):
         """Track attempt number for request/response logging."""
         self = retry_state.args[0]
-        self._naukri_retry_attempt = retry_state.attempt_number
+        self._retry_local.attempt = retry_state.attempt_number
 
     @staticmethod
     def _before_retry_log(retry_state):
@@ -2730,7 +3582,7 @@ class NaukriScraper(BaseScraper):
         """Make API request with automatic exponential backoff and detailed logging."""
         http_client = self.session if self.session else requests
 
-        attempt = getattr(self, '_naukri_retry_attempt', 1)
+        attempt = getattr(self._retry_local, 'attempt', 1)
         max_attempts = int(CONFIG['naukri'].get('max_retries', 3) or 3)
         timeout_s = CONFIG['naukri'].get('timeout', 15)
 
@@ -2800,19 +3652,20 @@ class NaukriScraper(BaseScraper):
 
         self.logger.info(f"   🔍 Starting API scrape for '{keyword}' in '{location}' (Up to {max_pages} pages)")
 
+        base_params = {
+            'noOfResults': CONFIG['naukri']['results_per_page'],
+            'urlType': 'search_by_keyword',
+            'searchType': 'adv',
+            'keyword': keyword,
+            'location': location,
+            'experience': f"{CONFIG['naukri']['experience_min']}-{CONFIG['naukri']['experience_max']}",
+            'freshness': CONFIG['naukri']['freshness'],
+        }
+
         for page in range(1, max_pages + 1):
             page_start_time = time.time()
             try:
-                params = {
-                    'noOfResults': CONFIG['naukri']['results_per_page'],
-                    'urlType': 'search_by_keyword',
-                    'searchType': 'adv',
-                    'keyword': keyword,
-                    'location': location,
-                    'experience': f"{CONFIG['naukri']['experience_min']}-{CONFIG['naukri']['experience_max']}",
-                    'freshness': CONFIG['naukri']['freshness'],
-                    'pageNo': page,
-                }
+                params = {**base_params, 'pageNo': page}
 
                 headers = self._get_api_headers()
 
@@ -2822,7 +3675,7 @@ class NaukriScraper(BaseScraper):
                 try:
                     data = response.json()
                 except Exception as e:
-                    self.stats['errors'] += 1
+                    self._incr_stat('errors')
                     self.logger.error(f"   ❌ Failed to decode Naukri JSON (page {page}): {type(e).__name__}: {e}")
                     if page == 1 and not jobs:
                         raise
@@ -2837,7 +3690,7 @@ class NaukriScraper(BaseScraper):
                 for job_data in job_list:
                     try:
                         job = self._parse_api_response(job_data, keyword)
-                        if job and self.validate_job(job) and self.apply_filters(job):
+                        if job:
                             jobs.append(job)
                             page_jobs_count += 1
                     except Exception as e:
@@ -2855,7 +3708,7 @@ class NaukriScraper(BaseScraper):
                     )
 
             except Exception as e:
-                self.stats['errors'] += 1
+                self._incr_stat('errors')
                 summary = self._summarize_exception(e)
                 self.logger.error(f"   ❌ Naukri API request failed on page {page} after retries: {summary}")
 
@@ -2886,18 +3739,12 @@ class NaukriScraper(BaseScraper):
             job_id = data.get('jobId', '')
             url = f"https://www.naukri.com/job-listings-{job_id}" if job_id else ""
             
-            return Job(
-                id=Job.generate_id(title, company, 'naukri'),
-                title=title,
-                company=company,
-                location=location,
+            return self._maybe_build_job(
+                title, company, location, url, 'naukri', keyword,
                 experience=experience,
                 salary=salary,
                 skills=skills[:10],
-                source='naukri',
                 source_id=job_id,
-                url=url,
-                keyword_matched=keyword,
             )
         except Exception as e:
             self.logger.debug(f"API parse error: {e}")
@@ -2907,9 +3754,10 @@ class NaukriScraper(BaseScraper):
         """Scrape using Selenium (fallback)"""
         jobs = []
         driver = None
+        healthy = True
         
         try:
-            driver = self.browser.get_selenium_driver()
+            driver = self.browser.acquire()
             
             search_url = f"https://www.naukri.com/{keyword.replace(' ', '-')}-jobs-in-{location}"
             driver.get(search_url)
@@ -2920,55 +3768,50 @@ class NaukriScraper(BaseScraper):
             self.browser.human_scroll(driver, times=5)
             
             # Parse job cards
-            soup = BeautifulSoup(driver.page_source, 'lxml')
-            cards = soup.find_all('article', class_='jobTuple')
+            dom = _parse_html(driver.page_source)
+            cards = _class_xpath('article', 'jobTuple')(dom)
             
             for card in cards:
                 try:
                     job = self._parse_selenium_card(card, keyword)
-                    if job and self.validate_job(job) and self.apply_filters(job):
+                    if job:
                         jobs.append(job)
                 except Exception as e:
                     self.logger.debug(f"Failed to parse Selenium card: {e}")
             
         except Exception as e:
+            healthy = False
             self.logger.error(f"Naukri Selenium error: {e}")
         finally:
             if driver:
-                driver.quit()
+                self.browser.release(driver, discard=not healthy)
         
         return jobs
     
     def _parse_selenium_card(self, card, keyword: str) -> Optional[Job]:
         """Parse job card from Selenium page"""
         try:
-            title_elem = card.find('a', class_='title')
-            company_elem = card.find('a', class_='subTitle')
-            location_elem = card.find('li', class_='location')
-            exp_elem = card.find('li', class_='experience')
-            salary_elem = card.find('li', class_='salary')
+            title_elem = _find_first(card, 'a', 'title')
+            company_elem = _find_first(card, 'a', 'subTitle')
+            location_elem = _find_first(card, 'li', 'location')
+            exp_elem = _find_first(card, 'li', 'experience')
+            salary_elem = _find_first(card, 'li', 'salary')
             
-            if not title_elem:
+            if title_elem is None:
                 return None
             
-            title = title_elem.get_text(strip=True)
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-            location = location_elem.get_text(strip=True) if location_elem else ""
-            experience = exp_elem.get_text(strip=True) if exp_elem else ""
-            salary = salary_elem.get_text(strip=True) if salary_elem else ""
+            title = _node_text(title_elem)
+            company = _node_text(company_elem) if company_elem is not None else "Unknown"
+            location = _node_text(location_elem) if location_elem is not None else ""
+            experience = _node_text(exp_elem) if exp_elem is not None else ""
+            salary = _node_text(salary_elem) if salary_elem is not None else ""
             
             url = title_elem.get('href', '')
             
-            return Job(
-                id=Job.generate_id(title, company, 'naukri'),
-                title=title,
-                company=company,
-                location=location,
+            return self._maybe_build_job(
+                title, company, location, url, 'naukri', keyword,
                 experience=experience,
                 salary=salary,
-                source='naukri',
-                url=url,
-                keyword_matched=keyword,
             )
         except Exception as e:
             self.logger.debug(f"Selenium card parse error: {e}")
@@ -2986,6 +3829,20 @@ class NaukriScraper(BaseScraper):
 class SupersetScraper(BaseScraper):
     """Superset college placement platform scraper"""
     
+    # Every element _parse_job_card reads, returned in document order by one traversal
+    _CARD_FIELDS_XPATH = etree.XPath(
+        ".//*[self::h3 or self::a"
+        " or (self::div and (" + " or ".join(
+            f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+            for name in ('title', 'company', 'ctc', 'deadline')
+        ) + "))"
+        " or (self::span and contains(concat(' ', normalize-space(@class), ' '), ' salary '))]"
+    )
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cookie_path = Path(CONFIG['paths']['cookies_dir']) / CONFIG['superset']['cookie_file']
+    
     def scrape_all(self) -> List[Job]:
         """Scrape Superset opportunities"""
         if not CONFIG['superset']['enabled']:
@@ -2993,50 +3850,62 @@ class SupersetScraper(BaseScraper):
             return []
         
         jobs = []
-        driver = None
         
         try:
-            driver = self.browser.get_selenium_driver(headless=True)
+            # Kept alive between runs; quit only on orchestrator shutdown
+            driver = self.browser.get_or_create('superset', headless=True)
             
-            # Attempt to load saved cookies
-            if CONFIG['superset']['use_saved_cookies']:
-                if self._load_cookies(driver):
-                    self.logger.info("Loaded saved Superset session")
-                else:
-                    if not self._login(driver):
-                        self.logger.error("Superset login failed")
-                        return []
-            else:
-                if not self._login(driver):
-                    self.logger.error("Superset login failed")
-                    return []
+            # A driver left on the dashboard by the previous run may still be logged in;
+            # skip the login page load and cookie refresh until the dashboard says otherwise
+            if self._on_dashboard(driver):
+                self.logger.info("Reusing Superset session")
+            elif not self._authenticate(driver):
+                self.logger.error("Superset login failed")
+                return []
             
             # Navigate to opportunities
-            self._navigate_to_jobs(driver)
+            cards_rendered = self._navigate_to_jobs(driver)
+            
+            # The server session can expire while the driver sits idle, which
+            # redirects the dashboard to login; log in again and retry once
+            if not self._on_dashboard(driver):
+                self.logger.info("Superset session expired, logging in again")
+                if not self._authenticate(driver):
+                    self.logger.error("Superset login failed")
+                    return []
+                cards_rendered = self._navigate_to_jobs(driver)
+                if not self._on_dashboard(driver):
+                    self.logger.error("Superset dashboard still redirects after login")
+                    return []
             
             # Scrape job cards
             jobs = self._scrape_job_cards(driver)
             self.stats['found'] = len(jobs)
             
-            # Save cookies for next time
-            self._save_cookies(driver)
+            # Save cookies for next time, only once rendered cards prove the session
+            # is live, so a logged-out page never overwrites the saved session
+            if cards_rendered:
+                self._save_cookies(driver)
             
         except Exception as e:
             self.logger.error(f"Superset scrape error: {e}")
             self.stats['errors'] += 1
-        finally:
-            if driver:
-                driver.quit()
         
         return jobs
     
+    def _authenticate(self, driver) -> bool:
+        """Restore the saved session if possible, otherwise log in"""
+        if CONFIG['superset']['use_saved_cookies'] and self._load_cookies(driver):
+            self.logger.info("Loaded saved Superset session")
+            return True
+        return self._login(driver)
+    
     def _login(self, driver) -> bool:
         """Login to Superset"""
         try:
             driver.get(CONFIG['superset']['login_url'])
-            time.sleep(3)
             
-            # Find and fill email
+            # Find and fill email (waits for the form to render)
             email_input = self.browser.wait_for_element(driver, 'input[type="email"]')
             self.browser.human_type(email_input, CONFIG['superset']['email'])
             
@@ -3045,14 +3914,10 @@ class SupersetScraper(BaseScraper):
             self.browser.human_type(password_input, CONFIG['superset']['password'])
             
             # Click login button
-            time.sleep(1)
             self.browser.safe_click(driver, 'button[type="submit"]')
             
-            # Wait for redirect
-            time.sleep(5)
-            
-            # Check if login successful
-            if 'login' not in driver.current_url.lower():
+            # Wait for redirect away from the login page
+            if self._wait_until_logged_in(driver, timeout=15):
                 self.logger.info("Superset login successful")
                 return True
             else:
@@ -3073,41 +3938,47 @@ class SupersetScraper(BaseScraper):
         self.logger.info(f"Please complete login manually within {timeout} seconds...")
         self.browser.take_screenshot(driver, "manual_login_required")
         
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            if 'login' not in driver.current_url.lower():
-                self.logger.info("Manual login completed")
-                return True
-            time.sleep(2)
+        if self._wait_until_logged_in(driver, timeout=timeout, poll_frequency=1):
+            self.logger.info("Manual login completed")
+            return True
         
         return False
     
+    @staticmethod
+    def _wait_until_logged_in(driver, timeout: float, poll_frequency: float = 0.5) -> bool:
+        """Poll until the browser has left the login page; False on timeout"""
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+                lambda d: 'login' not in d.current_url.lower()
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     def _load_cookies(self, driver) -> bool:
         """Load saved cookies"""
-        cookie_file = os.path.join(
-            CONFIG['paths']['cookies_dir'],
-            CONFIG['superset']['cookie_file']
-        )
-        
-        if not os.path.exists(cookie_file):
+        if not self._cookie_path.exists():
             return False
         
         try:
             driver.get(CONFIG['superset']['login_url'])
             
-            with open(cookie_file, 'r') as f:
-                cookies = json.load(f)
+            cookies = json.loads(self._cookie_path.read_bytes())
             
+            # Chrome rejects cookies for other domains; skip them without a round-trip
+            host = re.sub(r'^https?://([^/:]+).*$', r'\1', driver.current_url)
             for cookie in cookies:
+                domain = cookie.get('domain', '').lstrip('.')
+                if domain and not (host == domain or host.endswith('.' + domain)):
+                    continue
                 try:
                     driver.add_cookie(cookie)
                 except:
                     pass
             
             driver.refresh()
-            time.sleep(3)
             
-            return 'login' not in driver.current_url.lower()
+            return self._wait_until_logged_in(driver, timeout=3)
             
         except Exception as e:
             self.logger.debug(f"Failed to load cookies: {e}")
@@ -3115,40 +3986,52 @@ class SupersetScraper(BaseScraper):
     
     def _save_cookies(self, driver):
         """Save cookies for future use"""
-        cookie_file = os.path.join(
-            CONFIG['paths']['cookies_dir'],
-            CONFIG['superset']['cookie_file']
-        )
-        
         try:
             cookies = driver.get_cookies()
-            with open(cookie_file, 'w') as f:
-                json.dump(cookies, f)
+            if orjson is not None:
+                self._cookie_path.write_bytes(orjson.dumps(cookies))
+            else:
+                self._cookie_path.write_text(json.dumps(cookies))
             self.logger.debug("Saved Superset cookies")
         except Exception as e:
             self.logger.debug(f"Failed to save cookies: {e}")
     
-    def _navigate_to_jobs(self, driver):
-        """Navigate to jobs/opportunities page"""
+    @staticmethod
+    def _on_dashboard(driver) -> bool:
+        """Whether the driver is already showing the (authenticated) dashboard"""
+        try:
+            return driver.current_url.startswith(CONFIG['superset']['dashboard_url'])
+        except WebDriverException:
+            return False
+    
+    def _navigate_to_jobs(self, driver) -> bool:
+        """Navigate to jobs/opportunities page, returns whether any cards rendered"""
         driver.get(CONFIG['superset']['dashboard_url'])
-        time.sleep(3)
+        try:
+            WebDriverWait(driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'div.opportunity-card'))
+            )
+            return True
+        except TimeoutException:
+            self.logger.debug("No opportunity cards rendered on the Superset dashboard")
+            return False
     
     def _scrape_job_cards(self, driver) -> List[Job]:
         """Scrape job cards from dashboard"""
         jobs = []
         
         # Scroll to load more
-        self.browser.human_scroll(driver, times=CONFIG['superset']['max_pages'])
+        self.browser.scroll_to_end(driver, max_rounds=CONFIG['superset']['max_pages'])
         
-        soup = BeautifulSoup(driver.page_source, 'lxml')
+        dom = _parse_html(driver.page_source)
         
         # Find job cards (adjust selector based on actual page structure)
-        cards = soup.find_all('div', class_='opportunity-card')
+        cards = _class_xpath('div', 'opportunity-card')(dom)
         
         for card in cards:
             try:
                 job = self._parse_job_card(card)
-                if job and self.validate_job(job) and self.apply_filters(job):
+                if job:
                     jobs.append(job)
             except Exception as e:
                 self.logger.debug(f"Failed to parse Superset card: {e}")
@@ -3159,39 +4042,47 @@ class SupersetScraper(BaseScraper):
     def _parse_job_card(self, card) -> Optional[Job]:
         """Parse Superset opportunity card"""
         try:
-            title_elem = card.find('h3') or card.find('div', class_='title')
-            company_elem = card.find('div', class_='company')
-            ctc_elem = card.find('div', class_='ctc') or card.find('span', class_='salary')
-            deadline_elem = card.find('div', class_='deadline')
+            # First match per (tag, class) slot, same as a find() for each
+            slots = {}
+            for el in self._CARD_FIELDS_XPATH(card):
+                if el.tag in ('h3', 'a'):
+                    slots.setdefault(el.tag, el)
+                    continue
+                for name in el.get('class', '').split():
+                    slots.setdefault((el.tag, name), el)
+            
+            title_elem = slots.get('h3')
+            if title_elem is None:
+                title_elem = slots.get(('div', 'title'))
+            company_elem = slots.get(('div', 'company'))
+            ctc_elem = slots.get(('div', 'ctc'))
+            if ctc_elem is None:
+                ctc_elem = slots.get(('span', 'salary'))
+            deadline_elem = slots.get(('div', 'deadline'))
             
-            if not title_elem:
+            if title_elem is None:
                 return None
             
-            title = title_elem.get_text(strip=True)
-            company = company_elem.get_text(strip=True) if company_elem else "Unknown"
-            salary = ctc_elem.get_text(strip=True) if ctc_elem else ""
+            title = _node_text(title_elem)
+            company = _node_text(company_elem) if company_elem is not None else "Unknown"
+            salary = _node_text(ctc_elem) if ctc_elem is not None else ""
             
             deadline = None
-            if deadline_elem:
-                deadline_text = deadline_elem.get_text(strip=True)
+            if deadline_elem is not None:
+                deadline_text = _node_text(deadline_elem)
                 # Parse deadline (adjust format as needed)
             
             # Get URL
-            link = card.find('a')
-            url = link.get('href', '') if link else ""
+            link = slots.get('a')
+            url = link.get('href', '') if link is not None else ""
             if url and not url.startswith('http'):
                 url = f"https://superset.com{url}"
             
-            return Job(
-                id=Job.generate_id(title, company, 'superset'),
-                title=title,
-                company=company,
-                location="India",
+            return self._maybe_build_job(
+                title, company, "India", url, 'superset',
                 salary=salary,
                 deadline=deadline,
                 job_type="Campus Placement",
-                source='superset',
-                url=url,
             )
         except Exception as e:
             self.logger.debug(f"Superset card parse error: {e}")
@@ -3438,13 +4329,14 @@ class GovernmentJobsScraper(BaseScraper):
             'Accept-Language': 'en-US,en;q=0.9',
         }
         
-        # First, try to fetch with requests for better control
+        # First, try to fetch with requests for better control (over the shared
+        # keep-alive session, so retries and later runs reuse the connection)
         try:
-            response = requests.get(feed_url, headers=headers, timeout=timeout)
+            response = self.http.session.get(feed_url, headers=headers, timeout=timeout)
             response.raise_for_status()
             
             # Parse with feedparser
-            feed = feedparser.parse(response.content)
+            feed = feedparser.parse(response.content, **_FEEDPARSER_OPTIONS)
         except requests.exceptions.RequestException as e:
             self.logger.warning(f"Request failed for {feed_url}, trying feedparser directly: {e}")
             # Fallback to feedparser directly
@@ -3479,7 +4371,7 @@ class GovernmentJobsScraper(BaseScraper):
                 return None
             
             # Clean up title - remove extra whitespace
-            title = ' '.join(title.split()).strip()
+            title = ' '.join(title.split())
             
             # Extract link - validate URL format
             link = entry.get('link', '')
@@ -3500,11 +4392,9 @@ class GovernmentJobsScraper(BaseScraper):
             # Extract and clean description/summary
             description = ""
             if hasattr(entry, 'summary') and entry.summary:
-                soup = BeautifulSoup(entry.summary, 'html.parser')
-                description = soup.get_text(strip=True)[:500]
+                description = _fragment_text(entry.summary)[:500]
             elif hasattr(entry, 'description') and entry.description:
-                soup = BeautifulSoup(entry.description, 'html.parser')
-                description = soup.get_text(strip=True)[:500]
+                description = _fragment_text(entry.description)[:500]
             
             # Extract source/company from title or feed
             company = self._extract_company(title, feed_url)
@@ -3642,24 +4532,54 @@ import asyncio
 class TelegramPoster:
     """Post jobs to Telegram channel"""
     
+    # Upper bound (seconds) a sync caller waits on a single Bot API call
+    SEND_TIMEOUT = 30
+    
+    # RetryAfter waits honoured per message before giving up on it
+    MAX_RETRIES = 3
+    
+    # Bot API limits: ~30 messages/s per bot, 20 messages/min per group or channel
+    BOT_RATE = 30.0
+    CHAT_RATE_PER_MINUTE = 20
+    
+    # Markdown characters and escape backslashes dropped for plain-text fallback
+    _STRIP_TABLE = str.maketrans('', '', '*_`~\\')
+    
     def __init__(self):
         self.logger = LogManager.get_logger('TelegramPoster')
         self.bot = None
         self._loop = None
+        self._loop_thread = None
+        self._quiet_start = CONFIG['schedule']['quiet_hours_start']
+        self._quiet_end = CONFIG['schedule']['quiet_hours_end']
+        
+        # Every send waits on both buckets; a RetryAfter pauses all sends until
+        # _paused_until (loop time). Only touched from the bot loop thread.
+        self._bot_bucket = TokenBucket(self.BOT_RATE, capacity=self.BOT_RATE)
+        self._chat_buckets: Dict[Any, TokenBucket] = {}
+        self._paused_until = 0.0
         
         if CONFIG['telegram']['enabled']:
             self.bot = Bot(token=CONFIG['telegram']['bot_token'])
+            # Persistent loop served by a daemon thread so sync callers
+            # (including ones inside Colab/Jupyter's running loop) can submit to it
             self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever, name='TelegramLoop', daemon=True
+            )
+            self._loop_thread.start()
     
-    def _run_async(self, coro):
-        """Run async coroutine in event loop"""
+    def _run_async(self, coro, timeout: float = None):
+        """Run coroutine on the background loop and wait for its result"""
         if not self._loop:
+            coro.close()
             return None
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop)
         try:
-            return self._loop.run_until_complete(coro)
-        except Exception as e:
-            self.logger.error(f"Async error: {e}")
-            return None
+            return fut.result(timeout=timeout or self.SEND_TIMEOUT)
+        except FuturesTimeoutError:
+            fut.cancel()
+            raise
     
     async def _test_connection_async(self) -> bool:
         """Test Telegram bot connection (async version)"""
@@ -3676,67 +4596,134 @@ class TelegramPoster:
     
     def test_connection(self) -> bool:
         """Test Telegram bot connection"""
-        return self._run_async(self._test_connection_async())
+        try:
+            return bool(self._run_async(self._test_connection_async()))
+        except FuturesTimeoutError:
+            self.logger.error("Telegram connection test timed out")
+            return False
     
-    def post_job(self, job: Job) -> Optional[int]:
-        """Post single job, returns message_id"""
-        if not CONFIG['telegram']['enabled'] or not self.bot:
-            return None
-        
-        if self._is_quiet_hours():
-            self.logger.debug("Quiet hours - skipping post")
-            return None
-        
+    async def _throttle(self, chat_id):
+        """Wait out any RetryAfter pause, then take a slot from the bot and chat buckets"""
+        loop = asyncio.get_running_loop()
+        pause = self._paused_until - loop.time()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        
+        chat_bucket = self._chat_buckets.get(chat_id)
+        if chat_bucket is None:
+            chat_bucket = self._chat_buckets[chat_id] = TokenBucket(
+                self.CHAT_RATE_PER_MINUTE / 60, capacity=self.CHAT_RATE_PER_MINUTE
+            )
+        wait = max(self._bot_bucket.reserve(), chat_bucket.reserve())
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    async def _send_message(self, **kwargs):
+        """bot.send_message under the rate limits, waiting out RetryAfter up to MAX_RETRIES times"""
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._throttle(kwargs.get('chat_id'))
+            try:
+                return await self.bot.send_message(**kwargs)
+            except RetryAfter as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                self.logger.warning(f"Rate limited, pausing all sends for {e.retry_after}s")
+                # Hold back every queued send, not just this one
+                loop = asyncio.get_running_loop()
+                self._paused_until = max(self._paused_until, loop.time() + float(e.retry_after))
+    
+    async def _post_job_async(self, job: Job) -> Optional[int]:
+        """Send one job message on the bot loop, returns message_id"""
+        chat_id = CONFIG['telegram']['channel_id']
         try:
-            message = job.to_telegram_message()
+            message = job.telegram_message
             
             # Try MarkdownV2 first (required for proper escaping)
             try:
-                result = self._run_async(self.bot.send_message(
-                    chat_id=CONFIG['telegram']['channel_id'],
+                result = await self._send_message(
+                    chat_id=chat_id,
                     text=message,
                     parse_mode=ParseMode.MARKDOWN_V2,
                     disable_web_page_preview=True
-                ))
-            except:
+                )
+            except RetryAfter:
+                raise
+            except Exception:
                 # Fallback to plain text
                 plain_message = self._strip_formatting(message)
-                result = self._run_async(self.bot.send_message(
-                    chat_id=CONFIG['telegram']['channel_id'],
+                result = await self._send_message(
+                    chat_id=chat_id,
                     text=plain_message,
                     disable_web_page_preview=True
-                ))
+                )
             
             if result:
                 self.logger.debug(f"Posted job: {job.title}")
                 return result.message_id
             return None
             
-        except RetryAfter as e:
-            self.logger.warning(f"Rate limited, waiting {e.retry_after}s")
-            time.sleep(e.retry_after)
-            return self.post_job(job)
         except Exception as e:
             self.logger.error(f"Failed to post job: {e}")
             return None
     
-    def post_jobs(self, jobs: List[Job]) -> List[int]:
-        """Post multiple jobs with rate limiting"""
-        message_ids = []
+    async def _post_batch_async(self, jobs: List[Job]) -> List[Optional[int]]:
+        """Post jobs concurrently, starting sends at least post_delay_min..max apart"""
+        loop = asyncio.get_running_loop()
+        pacer = asyncio.Lock()
+        next_start = loop.time()
+        
+        async def paced_post(job: Job) -> Optional[int]:
+            nonlocal next_start
+            # The lock hands out start slots in submission order; the send itself runs unlocked
+            async with pacer:
+                delay = next_start - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                next_start = loop.time() + random.uniform(
+                    CONFIG['telegram']['post_delay_min'],
+                    CONFIG['telegram']['post_delay_max']
+                )
+            return await self._post_job_async(job)
         
-        for job in jobs:
-            msg_id = self.post_job(job)
-            if msg_id:
-                message_ids.append(msg_id)
-            
-            # Delay between posts
-            delay = random.uniform(
-                CONFIG['telegram']['post_delay_min'],
-                CONFIG['telegram']['post_delay_max']
-            )
-            time.sleep(delay)
+        return await asyncio.gather(*(paced_post(job) for job in jobs))
+    
+    def post_job(self, job: Job) -> Optional[int]:
+        """Post single job, returns message_id"""
+        if not CONFIG['telegram']['enabled'] or not self.bot:
+            return None
+        
+        if self._is_quiet_hours():
+            self.logger.debug("Quiet hours - skipping post")
+            return None
+        
+        try:
+            return self._run_async(self._post_job_async(job))
+        except FuturesTimeoutError:
+            self.logger.error(f"Timed out posting job: {job.title}")
+            return None
+    
+    def post_batch(self, jobs: List[Job]) -> List[Optional[int]]:
+        """Post jobs concurrently under the post-delay pacing, returns a message_id (or None) per job"""
+        if not jobs:
+            return []
+        if not CONFIG['telegram']['enabled'] or not self.bot:
+            return [None] * len(jobs)
+        
+        if self._is_quiet_hours():
+            self.logger.debug("Quiet hours - skipping post")
+            return [None] * len(jobs)
         
-        return message_ids
+        # Every send gets its own SEND_TIMEOUT on top of the pacing delays
+        timeout = len(jobs) * (self.SEND_TIMEOUT + CONFIG['telegram']['post_delay_max'])
+        try:
+            return self._run_async(self._post_batch_async(jobs), timeout=timeout)
+        except FuturesTimeoutError:
+            self.logger.error(f"Timed out posting a batch of {len(jobs)} jobs")
+            return [None] * len(jobs)
+    
+    def post_jobs(self, jobs: List[Job]) -> List[int]:
+        """Post multiple jobs with rate limiting"""
+        return [msg_id for msg_id in self.post_batch(jobs) if msg_id]
     
     def send_summary(self, stats: ScrapingStats):
         """Send run summary"""
@@ -3744,7 +4731,7 @@ class TelegramPoster:
             return
         
         try:
-            self._run_async(self.bot.send_message(
+            self._run_async(self._send_message(
                 chat_id=CONFIG['telegram']['channel_id'],
                 text=stats.get_summary(),
                 parse_mode=ParseMode.MARKDOWN
@@ -3761,7 +4748,7 @@ class TelegramPoster:
         chat_id = CONFIG['telegram'].get('admin_chat_id') or CONFIG['telegram']['channel_id']
         
         try:
-            self._run_async(self.bot.send_message(
+            self._run_async(self._send_message(
                 chat_id=chat_id,
                 text=f"⚠️ Scraper Error\n\n{message}",
                 parse_mode=ParseMode.MARKDOWN
@@ -3789,7 +4776,7 @@ class TelegramPoster:
         text = f"{emoji} *{scraper_name} Scraper*: {reason}\n`{ts}`"
 
         try:
-            self._run_async(self.bot.send_message(
+            self._run_async(self._send_message(
                 chat_id=chat_id,
                 text=text,
                 parse_mode=ParseMode.MARKDOWN,
@@ -3800,11 +4787,8 @@ class TelegramPoster:
     
     def _is_quiet_hours(self) -> bool:
         """Check if currently in quiet hours"""
-        now = datetime.now()
-        hour = now.hour
-        
-        start = CONFIG['schedule']['quiet_hours_start']
-        end = CONFIG['schedule']['quiet_hours_end']
+        hour = datetime.now().hour
+        start, end = self._quiet_start, self._quiet_end
         
         if start > end:
             return hour >= start or hour < end
@@ -3814,12 +4798,7 @@ class TelegramPoster:
     @staticmethod
     def _strip_formatting(text: str) -> str:
         """Remove Markdown formatting"""
-        # Remove markdown characters
-        for char in ['*', '_', '`', '~']:
-            text = text.replace(char, '')
-        # Fix escaped characters
-        text = text.replace('\\', '')
-        return text
+        return text.translate(TelegramPoster._STRIP_TABLE)
 
 
 # ============================================================================
@@ -3842,44 +4821,45 @@ class JobScraperOrchestrator:
         self.browser_manager = BrowserManager(self.proxy_manager)
         self.telegram = TelegramPoster()
         
-        # Initialize scrapers
-        self.linkedin_scraper = LinkedInScraper(
-            self.db,
-            self.proxy_manager,
-            self.http_client,
-            self.browser_manager,
-            telegram_poster=self.telegram,
-        )
-        self.indeed_scraper = IndeedScraper(
-            self.db,
-            self.proxy_manager,
-            self.http_client,
-            self.browser_manager,
-            telegram_poster=self.telegram,
-        )
-        self.naukri_scraper = NaukriScraper(
-            self.db,
-            self.proxy_manager,
-            self.http_client,
-            self.browser_manager,
-            telegram_poster=self.telegram,
-        )
-        self.superset_scraper = SupersetScraper(
-            self.db,
-            self.proxy_manager,
-            self.http_client,
-            self.browser_manager,
-            telegram_poster=self.telegram,
-        )
-        self.govt_scraper = GovernmentJobsScraper(
+        # Scrapers are cached properties, built on first access
+        self._running = False
+        # Set by shutdown(); wakes run_continuous out of its between-run wait
+        self._stop = threading.Event()
+    
+    def _build_scraper(self, scraper_cls):
+        """Construct a scraper wired to the shared components"""
+        return scraper_cls(
             self.db,
             self.proxy_manager,
             self.http_client,
             self.browser_manager,
             telegram_poster=self.telegram,
         )
-        
-        self._running = False
+    
+    @cached_property
+    def linkedin_scraper(self) -> LinkedInScraper:
+        """LinkedIn scraper, built on first access"""
+        return self._build_scraper(LinkedInScraper)
+    
+    @cached_property
+    def indeed_scraper(self) -> IndeedScraper:
+        """Indeed scraper, built on first access"""
+        return self._build_scraper(IndeedScraper)
+    
+    @cached_property
+    def naukri_scraper(self) -> NaukriScraper:
+        """Naukri scraper, built on first access"""
+        return self._build_scraper(NaukriScraper)
+    
+    @cached_property
+    def superset_scraper(self) -> SupersetScraper:
+        """Superset scraper, built on first access"""
+        return self._build_scraper(SupersetScraper)
+    
+    @cached_property
+    def govt_scraper(self) -> GovernmentJobsScraper:
+        """Government jobs scraper, built on first access"""
+        return self._build_scraper(GovernmentJobsScraper)
     
     def initialize(self) -> bool:
         """Initialize all components"""
@@ -3920,76 +4900,54 @@ class JobScraperOrchestrator:
         self.logger.info("STARTING SCRAPING RUN")
         self.logger.info("=" * 60)
         
-        all_jobs = []
+        # Keyed by job id so postings seen by several sources reach the DB once
+        all_jobs: Dict[str, Job] = {}
+        found = 0
         
         try:
-            # Scrape LinkedIn
-            if CONFIG['linkedin']['enabled']:
-                linkedin_jobs = self.linkedin_scraper.scrape_all()
-                all_jobs.extend(linkedin_jobs)
-                linkedin_stats = self.linkedin_scraper.get_stats()
-                stats.linkedin_jobs = linkedin_stats['found']
-                stats.linkedin_errors = linkedin_stats['errors']
-            
-            # Scrape Indeed
-            if CONFIG['indeed']['enabled']:
-                indeed_jobs = self.indeed_scraper.scrape_all()
-                all_jobs.extend(indeed_jobs)
-                indeed_stats = self.indeed_scraper.get_stats()
-                stats.indeed_jobs = indeed_stats['found']
-                stats.indeed_errors = indeed_stats['errors']
+            # Scrape every enabled source; each talks to its own site, so they run in parallel
+            # Disabled sources are never touched, so their scrapers are never built
+            scrapers = ['linkedin', 'indeed', 'naukri', 'superset', 'govt']
+            enabled = [(name, getattr(self, f'{name}_scraper')) for name in scrapers if CONFIG[name]['enabled']]
             
-            # Scrape Naukri
-            if CONFIG['naukri']['enabled']:
-                naukri_jobs = self.naukri_scraper.scrape_all()
-                all_jobs.extend(naukri_jobs)
-                naukri_stats = self.naukri_scraper.get_stats()
-                stats.naukri_jobs = naukri_stats['found']
-                stats.naukri_errors = naukri_stats['errors']
-            
-            # Scrape Superset
-            if CONFIG['superset']['enabled']:
-                superset_jobs = self.superset_scraper.scrape_all()
-                all_jobs.extend(superset_jobs)
-                superset_stats = self.superset_scraper.get_stats()
-                stats.superset_jobs = superset_stats['found']
-                stats.superset_errors = superset_stats['errors']
-            
-            # Scrape Government Jobs
-            if CONFIG['govt']['enabled']:
-                govt_jobs = self.govt_scraper.scrape_all()
-                all_jobs.extend(govt_jobs)
-                govt_stats = self.govt_scraper.get_stats()
-                stats.govt_jobs = govt_stats['found']
-                stats.govt_errors = govt_stats['errors']
+            if enabled:
+                workers = int(CONFIG['scraping'].get('concurrent_scrapers', 1) or 1)
+                workers = max(1, min(workers, len(enabled)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scraper') as executor:
+                    futures = {executor.submit(scraper.scrape_all): (name, scraper) for name, scraper in enabled}
+                    for future in as_completed(futures):
+                        name, scraper = futures[future]
+                        try:
+                            jobs = future.result()
+                            found += len(jobs)
+                            for job in jobs:
+                                all_jobs.setdefault(job.id, job)
+                        except Exception as e:
+                            # One failing source shouldn't discard the others' results
+                            self.logger.error(f"{name} scraper failed: {e}")
+                            scraper._incr_stat('errors')
+                        scraper_stats = scraper.get_stats()
+                        setattr(stats, f'{name}_jobs', scraper_stats['found'])
+                        setattr(stats, f'{name}_errors', scraper_stats['errors'])
             
             # Save all jobs
-            self.logger.info(f"Total jobs found: {len(all_jobs)}")
-            for job in all_jobs:
-                if self.db.save_job(job):
-                    if job.source == 'linkedin':
-                        stats.linkedin_new += 1
-                    elif job.source == 'indeed':
-                        stats.indeed_new += 1
-                    elif job.source == 'naukri':
-                        stats.naukri_new += 1
-                    elif job.source == 'superset':
-                        stats.superset_new += 1
-                    elif job.source == 'govt':
-                        stats.govt_new += 1
+            self.logger.info(f"Total jobs found: {found} ({found - len(all_jobs)} duplicates dropped before saving)")
+            new_by_source = self.db.save_jobs_bulk(list(all_jobs.values()))
+            for name in scrapers:
+                setattr(stats, f'{name}_new', new_by_source.get(name, 0))
             
             self.logger.info(f"New jobs saved: {stats.total_new}")
             
-            # Post to Telegram
-            if CONFIG['telegram']['enabled']:
+            # Post to Telegram (nothing would be sent during quiet hours, so skip the fetch too)
+            if CONFIG['telegram']['enabled'] and self.telegram._is_quiet_hours():
+                self.logger.info("Quiet hours - leaving new jobs queued for the next run")
+            elif CONFIG['telegram']['enabled']:
                 unposted = self.db.get_unposted_jobs(CONFIG['telegram']['batch_size'])
-                for job in unposted:
-                    msg_id = self.telegram.post_job(job)
-                    if msg_id:
-                        self.db.mark_as_posted(job.id, msg_id)
-                        stats.jobs_posted += 1
-                    else:
-                        stats.posting_errors += 1
+                message_ids = self.telegram.post_batch(unposted)
+                posted = [(job.id, msg_id) for job, msg_id in zip(unposted, message_ids) if msg_id]
+                self.db.mark_many_as_posted(posted)
+                stats.jobs_posted += len(posted)
+                stats.posting_errors += len(unposted) - len(posted)
             
             # Export data
             if CONFIG['data']['export_after_each_run']:
@@ -4009,7 +4967,7 @@ class JobScraperOrchestrator:
             self.logger.error(f"Run failed with error: {e}")
             self.telegram.send_error(str(e))
         finally:
-            self.browser_manager.quit_all()
+            self.http_client.flush_proxy_reports()
             self._running = False
         
         self.logger.info("=" * 60)
@@ -4018,24 +4976,42 @@ class JobScraperOrchestrator:
         
         return stats
     
-    def run_continuous(self):
-        """Run scraping continuously with intervals"""
+    async def run_once_async(self) -> ScrapingStats:
+        """Run single scraping cycle without blocking the caller's event loop
+        
+        Sources already scrape concurrently inside run_once; this just moves the
+        cycle off the loop so notebooks and async callers can await it.
+        """
+        return await asyncio.to_thread(self.run_once)
+    
+    def run_continuous(self, interval_hours: Optional[float] = None):
+        """Run scraping continuously with intervals (default: schedule.run_interval_hours)"""
         self.logger.info("Starting continuous scraping mode...")
         
-        while True:
-            try:
-                self.run_once()
-                
-                interval_hours = CONFIG['schedule']['run_interval_hours']
-                self.logger.info(f"Sleeping for {interval_hours} hours until next run...")
-                time.sleep(interval_hours * 3600)
-                
-            except KeyboardInterrupt:
-                self.logger.info("Interrupted by user")
-                break
-            except Exception as e:
-                self.logger.error(f"Continuous run error: {e}")
-                time.sleep(300)  # Wait 5 minutes before retry
+        self._stop.clear()
+        try:
+            while not self._stop.is_set():
+                try:
+                    # Runs are scheduled start-to-start, so cycle duration doesn't accumulate as drift
+                    started = time.monotonic()
+                    self.run_once()
+                    
+                    hours = interval_hours or CONFIG['schedule']['run_interval_hours']
+                    remaining = max(0.0, started + hours * 3600 - time.monotonic())
+                    self.logger.info(f"Next run in {remaining / 3600:.2f} hours...")
+                    self._stop.wait(remaining)
+                    
+                except KeyboardInterrupt:
+                    self.logger.info("Interrupted by user")
+                    break
+                except Exception as e:
+                    self.logger.error(f"Continuous run error: {e}")
+                    self._stop.wait(300)  # Wait 5 minutes before retry
+        finally:
+            # Drivers are only kept alive between cycles
+            self.browser_manager.quit_all()
+        
+        self.logger.info("Continuous scraping stopped")
     
     def get_status(self) -> dict:
         """Get current status"""
@@ -4048,11 +5024,13 @@ class JobScraperOrchestrator:
     def shutdown(self):
         """Graceful shutdown"""
         self.logger.info("Shutting down...")
+        self._stop.set()
         self.browser_manager.quit_all()
         
         # Final export
         self.db.export_to_csv()
         self.db.export_to_json()
+        self.db.close()
         
         self.logger.info("Shutdown complete")
 
@@ -4067,31 +5045,66 @@ class JobScraperOrchestrator:
 # Global orchestrator instance
 orchestrator = None
 
-def initialize():
-    """Initialize the scraper"""
+# Startup steps already done for the current orchestrator (see _ensure_component)
+_ready_components: Set[str] = set()
+
+_orchestrator_lock = threading.Lock()
+
+def _create_orchestrator():
+    """Build a fresh global orchestrator without running its startup checks"""
     global orchestrator
     # Setup environment (create directories) before initializing anything else
     setup_environment()
     LogManager().setup()
     orchestrator = JobScraperOrchestrator()
-    return orchestrator.initialize()
+    _ready_components.clear()
+    return orchestrator
+
+def initialize():
+    """Initialize the scraper"""
+    result = _create_orchestrator().initialize()
+    _ready_components.add('proxies')
+    return result
+
+def _get_orchestrator() -> JobScraperOrchestrator:
+    """The process-wide orchestrator, initialized on first use"""
+    if orchestrator is None:
+        with _orchestrator_lock:
+            if orchestrator is None:
+                initialize()
+    return orchestrator
+
+def _ensure_component(name: str):
+    """Return one scraper (by source name) or 'telegram', building only what it needs
+    
+    Unlike initialize(), this skips config validation and the Telegram connection
+    test, and only fetches proxies when a scraper is requested with proxies enabled.
+    """
+    if not orchestrator:
+        _create_orchestrator()
+    if name == 'telegram':
+        return orchestrator.telegram
+    if CONFIG['proxy']['enabled'] and 'proxies' not in _ready_components:
+        orchestrator.proxy_manager.initialize()
+        _ready_components.add('proxies')
+    return getattr(orchestrator, f'{name}_scraper')
 
 def run():
     """Run single scraping cycle"""
-    if not orchestrator:
-        initialize()
-    return orchestrator.run_once()
+    _get_orchestrator()
+    try:
+        return orchestrator.run_once()
+    finally:
+        orchestrator.browser_manager.quit_all()
 
-def run_continuous():
+def run_continuous(interval_hours: Optional[float] = None):
     """Run continuously"""
-    if not orchestrator:
-        initialize()
-    orchestrator.run_continuous()
+    _get_orchestrator()
+    orchestrator.run_continuous(interval_hours)
 
 def show_stats():
     """Display database statistics"""
-    if not orchestrator:
-        initialize()
+    _get_orchestrator()
     stats = orchestrator.db.get_stats()
     print("\n📊 DATABASE STATISTICS")
     print("=" * 40)
@@ -4104,8 +5117,7 @@ def show_stats():
 
 def show_recent_jobs(limit: int = 20):
     """Display recent jobs"""
-    if not orchestrator:
-        initialize()
+    _get_orchestrator()
     
     jobs = orchestrator.db.get_unposted_jobs(limit)
     print(f"\n📋 RECENT JOBS ({len(jobs)})")
@@ -4117,43 +5129,32 @@ def show_recent_jobs(limit: int = 20):
 
 def test_linkedin():
     """Test LinkedIn scraper"""
-    if not orchestrator:
-        initialize()
-    jobs = orchestrator.linkedin_scraper.scrape_all()
+    jobs = _ensure_component('linkedin').scrape_all()
     print(f"Found {len(jobs)} LinkedIn jobs")
     return jobs
 
 def test_indeed():
     """Test Indeed scraper"""
-    if not orchestrator:
-        initialize()
-    jobs = orchestrator.indeed_scraper.scrape_all()
+    jobs = _ensure_component('indeed').scrape_all()
     print(f"Found {len(jobs)} Indeed jobs")
     return jobs
 
 def test_naukri():
     """Test Naukri scraper"""
-    if not orchestrator:
-        initialize()
-    jobs = orchestrator.naukri_scraper.scrape_all()
+    jobs = _ensure_component('naukri').scrape_all()
     print(f"Found {len(jobs)} Naukri jobs")
     return jobs
 
 def test_superset():
     """Test Superset scraper"""
-    if not orchestrator:
-        initialize()
-    jobs = orchestrator.superset_scraper.scrape_all()
+    jobs = _ensure_component('superset').scrape_all()
     print(f"Found {len(jobs)} Superset jobs")
     return jobs
 
 
 def initialize_gov_scraper():
     """Initialize GovernmentJobsScraper and validate feed connectivity."""
-    if not orchestrator:
-        initialize()
-
-    scraper = orchestrator.govt_scraper
+    scraper = _ensure_component('govt')
     scraper.logger.info("🏛 Initializing Government Jobs Scraper...")
 
     report = test_gov_scraper_feeds()
@@ -4175,10 +5176,7 @@ def test_gov_scraper_feeds(timeout: int = 5):
 
     Returns a dict keyed by feed_url with ok/status/elapsed/error fields.
     """
-    if not orchestrator:
-        initialize()
-
-    scraper = orchestrator.govt_scraper
+    scraper = _ensure_component('govt')
 
     # Prefer optimized feed lists if present in config.py
     try:
@@ -4205,7 +5203,7 @@ def test_gov_scraper_feeds(timeout: int = 5):
     def _check_feed(feed_url: str) -> Tuple[str, dict]:
         start = time.time()
         try:
-            resp = requests.get(feed_url, headers=headers, timeout=timeout)
+            resp = scraper.http.session.get(feed_url, headers=headers, timeout=timeout)
             elapsed = time.time() - start
             ok = 200 <= resp.status_code < 400
             return feed_url, {
@@ -4253,10 +5251,7 @@ def test_government_jobs():
 
     Keeps runtime low for fast debugging.
     """
-    if not orchestrator:
-        initialize()
-
-    scraper = orchestrator.govt_scraper
+    scraper = _ensure_component('govt')
 
     # Use primary feeds when available, otherwise fall back to first 2 configured feeds
     try:
@@ -4314,8 +5309,7 @@ def test_government_jobs():
 
 def test_telegram():
     """Send test message to Telegram"""
-    if not orchestrator:
-        initialize()
+    telegram = _ensure_component('telegram')
     
     test_job = Job(
         id="test123",
@@ -4328,7 +5322,7 @@ def test_telegram():
         salary="5-10 LPA",
     )
     
-    msg_id = orchestrator.telegram.post_job(test_job)
+    msg_id = telegram.post_job(test_job)
     if msg_id:
         print(f"✅ Test message sent! Message ID: {msg_id}")
     else:
@@ -4336,70 +5330,47 @@ def test_telegram():
 
 def export_all():
     """Export all data"""
-    if not orchestrator:
-        initialize()
+    _get_orchestrator()
     csv_path = orchestrator.db.export_to_csv()
     json_path = orchestrator.db.export_to_json()
     print(f"✅ Exported to:\n  CSV: {csv_path}\n  JSON: {json_path}")
 
 def force_post_all():
     """Force post all unposted jobs"""
-    if not orchestrator:
-        initialize()
+    _get_orchestrator()
     
     unposted = orchestrator.db.get_unposted_jobs(100)
     print(f"Posting {len(unposted)} jobs...")
     
+    posted = []
     for job in unposted:
         msg_id = orchestrator.telegram.post_job(job)
         if msg_id:
-            orchestrator.db.mark_as_posted(job.id, msg_id)
+            posted.append((job.id, msg_id))
             print(f"✅ Posted: {job.title}")
         else:
             print(f"❌ Failed: {job.title}")
+    orchestrator.db.mark_many_as_posted(posted)
 
 def cleanup(days: int = 30):
     """Cleanup old jobs"""
-    if not orchestrator:
-        initialize()
+    _get_orchestrator()
     deleted = orchestrator.db.cleanup_old_jobs(days)
     print(f"🗑️ Deleted {deleted} jobs older than {days} days")
 
 def search_jobs(query: str) -> List[Job]:
     """Search jobs in database"""
-    if not orchestrator:
-        initialize()
-    
-    conn = orchestrator.db._get_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT * FROM jobs 
-        WHERE title LIKE ? OR company LIKE ? OR location LIKE ?
-        ORDER BY scraped_at DESC LIMIT 50
-    ''', (f'%{query}%', f'%{query}%', f'%{query}%'))
-    rows = cursor.fetchall()
-    conn.close()
-    
-    jobs = [orchestrator.db._row_to_job(row) for row in rows]
+    _get_orchestrator()
+    
+    jobs = orchestrator.db.search_jobs(query)
     print(f"Found {len(jobs)} jobs matching '{query}'")
     return jobs
 
 def get_job_by_company(company: str) -> List[Job]:
     """Get all jobs from a specific company"""
-    if not orchestrator:
-        initialize()
-    
-    conn = orchestrator.db._get_connection()
-    cursor = conn.cursor()
-    cursor.execute('''
-        SELECT * FROM jobs 
-        WHERE company LIKE ?
-        ORDER BY scraped_at DESC
-    ''', (f'%{company}%',))
-    rows = cursor.fetchall()
-    conn.close()
-    
-    jobs = [orchestrator.db._row_to_job(row) for row in rows]
+    _get_orchestrator()
+    
+    jobs = orchestrator.db.get_jobs_by_company(company)
     print(f"Found {len(jobs)} jobs from '{company}'")
     return jobs
 
@@ -43,18 +43,76 @@ def setup_logging():
     return log_manager
 
 
-def main():
-    """Main entry point with CLI interface"""
+def _cmd_test_telegram(args, orchestrator, logger):
+    """--test-telegram; returns non-zero on failure"""
+    if orchestrator.telegram.test_connection():
+        logger.info("Telegram connection successful")
+        return 0
+    logger.error("Telegram connection failed")
+    return 1
+
+
+def _cmd_show_stats(args, orchestrator, logger):
+    """--show-stats"""
+    stats = orchestrator.get_status()
+    logger.info("Current status:")
+    for key, value in stats.items():
+        logger.info(f"  {key}: {value}")
+
+
+def _cmd_export(args, orchestrator, logger):
+    """--export-csv / --export-json"""
+    if args.export_csv:
+        filepath = orchestrator.db.export_to_csv()
+        logger.info(f"Exported to CSV: {filepath}")
+    if args.export_json:
+        filepath = orchestrator.db.export_to_json()
+        logger.info(f"Exported to JSON: {filepath}")
+
+
+def _cmd_cleanup(args, orchestrator, logger):
+    """--cleanup DAYS"""
+    deleted = orchestrator.db.cleanup_old_jobs(args.cleanup)
+    logger.info(f"Cleaned up {deleted} jobs older than {args.cleanup} days")
+
+
+def _cmd_run(args, orchestrator, logger):
+    """--run / --continuous"""
+    if args.continuous:
+        logger.info("Starting continuous scraping mode...")
+        orchestrator.run_continuous(args.interval)
+    else:
+        logger.info("Running single scraping cycle...")
+        try:
+            stats = orchestrator.run_once()
+        finally:
+            orchestrator.browser_manager.quit_all()
+        logger.info(f"Run complete: {stats.total_new} new jobs found")
+
+
+# (flags, command) run in this order for every flag given on the command line
+COMMANDS = (
+    (('test_telegram',), _cmd_test_telegram),
+    (('show_stats',), _cmd_show_stats),
+    (('export_csv', 'export_json'), _cmd_export),
+    (('cleanup',), _cmd_cleanup),
+    (('run', 'continuous'), _cmd_run),
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser"""
     parser = argparse.ArgumentParser(
         description='Multi-Platform Job Scraper Bot',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""Examples:
   python main.py --run
   python main.py --run --continuous
+  python main.py --continuous --interval 2
   python main.py --test-telegram
   python main.py --show-stats
   python main.py --export-csv --export-json
-  python main.py --cleanup --days 30
+  python main.py --cleanup 30
         
 For Google Colab, run: initialize() and then run() or run_continuous()
         """
@@ -64,6 +122,8 @@ For Google Colab, run: initialize() and then run() or run_continuous()
                         help='Run a single scraping cycle')
     parser.add_argument('--continuous', action='store_true',
                         help='Run continuously with configured intervals')
+    parser.add_argument('--interval', type=float, metavar='HOURS',
+                        help='Hours between continuous runs (overrides the schedule config)')
     parser.add_argument('--test-telegram', action='store_true',
                         help='Test Telegram bot connection')
     parser.add_argument('--show-stats', action='store_true',
@@ -77,6 +137,12 @@ For Google Colab, run: initialize() and then run() or run_continuous()
     parser.add_argument('--setup-colab', action='store_true',
                         help='Set up Colab environment (mount drive)')
     
+    return parser
+
+
+def main():
+    """Main entry point with CLI interface"""
+    parser = build_parser()
     args = parser.parse_args()
     
     # Create required directories first
@@ -102,43 +168,15 @@ For Google Colab, run: initialize() and then run() or run_continuous()
     orchestrator = JobScraperOrchestrator()
     orchestrator.initialize()
     
-    # Execute commands based on arguments
-    if args.test_telegram:
-        if orchestrator.telegram.test_connection():
-            logger.info("Telegram connection successful")
-        else:
-            logger.error("Telegram connection failed")
-            return 1
+    # Execute commands based on arguments, in table order
+    ran_any = False
+    for flags, command in COMMANDS:
+        if any(getattr(args, flag) for flag in flags):
+            ran_any = True
+            if command(args, orchestrator, logger):
+                return 1
     
-    if args.show_stats:
-        stats = orchestrator.get_status()
-        logger.info("Current status:")
-        for key, value in stats.items():
-            logger.info(f"  {key}: {value}")
-    
-    if args.export_csv or args.export_json:
-        if args.export_csv:
-            filepath = orchestrator.db.export_to_csv()
-            logger.info(f"Exported to CSV: {filepath}")
-        if args.export_json:
-            filepath = orchestrator.db.export_to_json()
-            logger.info(f"Exported to JSON: {filepath}")
-    
-    if args.cleanup:
-        deleted = orchestrator.db.cleanup_old_jobs(args.cleanup)
-        logger.info(f"Cleaned up {deleted} jobs older than {args.cleanup} days")
-    
-    if args.run or args.continuous:
-        if args.continuous:
-            logger.info("Starting continuous scraping mode...")
-            orchestrator.run_continuous()
-        else:
-            logger.info("Running single scraping cycle...")
-            stats = orchestrator.run_once()
-            logger.info(f"Run complete: {stats.total_new} new jobs found")
-    elif not any([args.test_telegram, args.show_stats, 
-                  args.export_csv, args.export_json, 
-                  args.cleanup, args.setup_colab]):
+    if not (ran_any or args.setup_colab):
         parser.print_help()
     
     return 0
@@ -198,32 +236,37 @@ class InteractiveScraper:
         raise AttributeError(f"No attribute '{name}'")
 
 
-# Global interactive instance
-_interactive_instance = InteractiveScraper()
+# Global interactive instance, created on first use so importing this module has no side effects
+_interactive_instance = None
+
+
+def _get_interactive_instance() -> InteractiveScraper:
+    """The shared InteractiveScraper, created on first use"""
+    global _interactive_instance
+    if _interactive_instance is None:
+        _interactive_instance = InteractiveScraper()
+    return _interactive_instance
 
 
 def initialize():
     """Interactive function for Jupyter/Colab"""
-    setup_environment()
-    return _interactive_instance.initialize()
+    setup_colab_environment()
+    return _get_interactive_instance().initialize()
 
 
 def run():
     """Interactive function for single run"""
-    return _interactive_instance.run()
+    return _get_interactive_instance().run()
 
 
 def run_continuous(interval_hours=None):
     """Interactive function for continuous mode"""
-    if interval_hours is not None:
-        from job_scraper import CONFIG
-        CONFIG['schedule']['run_interval_hours'] = interval_hours
-    return _interactive_instance.run_continuous()
+    return _get_interactive_instance().run_continuous(interval_hours)
 
 
 def get_stats():
     """Interactive function for status"""
-    stats = _interactive_instance.get_stats()
+    stats = _get_interactive_instance().get_stats()
     if stats:
         print("Current Status:")
         for key, value in stats.items():
@@ -233,7 +276,7 @@ def get_stats():
 
 def shutdown():
     """Interactive function for shutdown"""
-    _interactive_instance.shutdown()
+    _get_interactive_instance().shutdown()
 
 
 if __name__ == "__main__":
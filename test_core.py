@@ -179,6 +179,86 @@ def test_database_basic():
         traceback.print_exc()
         return False
 
+def test_database_manager_batch():
+    """Test DatabaseManager batched saves with a temp database"""
+    print("\n🗄️ Testing DatabaseManager batch save...")
+    
+    temp_dir = tempfile.mkdtemp()
+    try:
+        from job_scraper import CONFIG, DatabaseManager, Job
+        
+        original_dir = CONFIG['paths']['database_dir']
+        CONFIG['paths']['database_dir'] = temp_dir
+        try:
+            db = DatabaseManager()
+        finally:
+            CONFIG['paths']['database_dir'] = original_dir
+        
+        jobs = [
+            Job(
+                id=Job.generate_id(f"Engineer {i}", "Test Company", "test"),
+                title=f"Engineer {i}",
+                company="Test Company",
+                location="Bangalore",
+                source="test",
+                url=f"https://example.com/job/{i}",
+                skills=["Python"] if i % 2 else [],
+            )
+            for i in range(5)
+        ]
+        
+        # First save inserts everything, second save only the new job
+        assert db.save_jobs(jobs) == 5
+        extra = Job(id="extra", title="Extra", company="Other", location="",
+                    source="test", url="https://example.com/extra")
+        assert db.save_jobs(jobs + [extra]) == 1
+        
+        # Bulk save reports new rows per source
+        other = Job(id="other", title="Other", company="Other", location="",
+                    source="other", url="https://example.com/other")
+        assert db.save_jobs_bulk(jobs + [other]) == {"other": 1}
+        
+        stats = db.get_stats()
+        assert stats['total_jobs'] == 7
+        assert stats['unposted'] == 7
+        
+        # Substring search goes through the FTS index (LIKE for short queries)
+        assert len(db.search_jobs("ngineer")) == 5
+        assert len(db.search_jobs("galo")) == 5
+        assert [j.id for j in db.get_jobs_by_company("othe")] != []
+        assert len(db.get_jobs_by_company("st Comp")) == 5
+        assert len(db.search_jobs("Ex")) == 1
+        
+        # Renumbered rowids (as VACUUM may do) are detected and the index rebuilt on open
+        db.close()
+        import sqlite3
+        conn = sqlite3.connect(db.db_path)
+        with conn:
+            conn.execute("UPDATE jobs SET rowid = rowid + 100")
+        conn.close()
+        CONFIG['paths']['database_dir'] = temp_dir
+        try:
+            db = DatabaseManager()
+        finally:
+            CONFIG['paths']['database_dir'] = original_dir
+        assert [j.id for j in db.get_jobs_by_company("Other")] != []
+        assert all(j.company == "Other" for j in db.get_jobs_by_company("Other"))
+        assert len(db.search_jobs("ngineer")) == 5
+        db.close()
+        
+        print("✅ DatabaseManager batch save working")
+        print(f"   Stats: {stats}")
+        
+        return True
+    except Exception as e:
+        print(f"❌ DatabaseManager batch test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        # Re-raise so pytest reports the failure; main() still counts it
+        raise
+    finally:
+        shutil.rmtree(temp_dir, ignore_errors=True)
+
 def test_configuration():
     """Test configuration structure"""
     print("\n⚙️ Testing configuration...")
@@ -249,6 +329,36 @@ def test_exceptions():
         traceback.print_exc()
         return False
 
+def test_scraper_filters():
+    """Test BaseScraper.apply_filters on accepted and excluded jobs"""
+    print("\n🔍 Testing scraper filters...")
+    
+    try:
+        from job_scraper import IndeedScraper, Job
+        
+        # Filters only need config, not the shared components
+        scraper = IndeedScraper(None, None, None, None)
+        
+        accepted = Job(id="ok", title="Software Engineer", company="Test Company",
+                       location="Bangalore", source="test",
+                       url="https://example.com/ok", experience="0-1 years")
+        excluded = Job(id="senior", title="Senior Software Engineer", company="Test Company",
+                       location="Bangalore", source="test",
+                       url="https://example.com/senior")
+        
+        assert scraper.apply_filters(accepted) is True
+        assert scraper.apply_filters(excluded) is False
+        
+        print("✅ Scraper filters working correctly")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Scraper filters test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        # Re-raise so pytest reports the failure; main() still counts it
+        raise
+
 def main():
     """Run core functionality tests"""
     print("""
@@ -261,8 +371,10 @@ def main():
         ("Job Class", test_job_class),
         ("ScrapingStats", test_scraping_stats),
         ("Database", test_database_basic),
+        ("DatabaseManager Batch", test_database_manager_batch),
         ("Configuration", test_configuration),
         ("Exceptions", test_exceptions),
+        ("Scraper Filters", test_scraper_filters),
     ]
     
     results = []